@@ -1,10 +1,7 @@
 import os
 import sys
-import requests
 from io import BytesIO
 
-from dotenv import load_dotenv
-
 from box_sdk_gen import BoxClient, BoxDeveloperTokenAuth
 
 from box_sdk_gen.managers.uploads import UploadFileAttributes, UploadFileAttributesParentField
@@ -12,7 +9,7 @@ from box_sdk_gen.box.errors import BoxAPIError, BoxSDKError
 from box_sdk_gen.schemas import Files
 
 sys.path.append("../layers/shared/python/")  # Necessary for DEV staging. AWS auto imports this file
-from api import get_box_client
+from api import get_box_client, get_s3_download_session, S3_DOWNLOAD_TIMEOUT_SECONDS
 
 """
 Script to upload a file to a Box folder using the Box Python SDK.
@@ -23,30 +20,34 @@ Requirements:
 """
 
 
-load_dotenv()
 FILE_PATH = "sample_epr.pdf"  # Replace with filename from Smartsheet
 FOLDER_ID = "372200130812"  # Replace with box com file id from URL
 
-def upload_file_to_box_by_url(s3_url, filename, folder_id=FOLDER_ID):
+s3_session = get_s3_download_session()  # Reused across uploads
+
+def upload_file_to_box_by_url(s3_url, filename, folder_id=FOLDER_ID, client: BoxClient = None):
     """
     Upload a file to Box through s3_url.
     
     Args:
         file_path: AWS S3 Url path to the file to upload
         folder_id: Box folder ID (default '0' is root folder)
+        client: Box client to reuse across uploads. A new one is authenticated when not given.
     
     Returns:
         Uploaded file object
     """
 
     # Get Box client
-    client: BoxClient = get_box_client()
+    if client is None:
+        client = get_box_client()
     
     # Upload file to box com
     uploaded_files: Files | None = None
     # print(f"Uploading {s3_url} to Box folder {folder_id}...")
     try:
-        response = requests.get(s3_url)
+        response = s3_session.get(s3_url, timeout=S3_DOWNLOAD_TIMEOUT_SECONDS)
+        response.raise_for_status()  # Don't upload an S3 error page as the EPR
 
         pdf_file = BytesIO(response.content)
         uploaded_files = client.uploads.upload_file(
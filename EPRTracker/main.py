@@ -1,16 +1,20 @@
 import sys
 import logging
 from datetime import date, datetime
+from dateutil.relativedelta import relativedelta
 from collections import defaultdict
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import smartsheet
 from smartsheet.smartsheet import Smartsheet
 from smartsheet.sheets import Sheets
 from smartsheet.attachments import Attachments
+from smartsheet.discussions import Discussions
 from smartsheet.models.index_result import IndexResult
 from smartsheet.models import Attachment, Error
 
+from box_sdk_gen import BoxClient
+
 from model import SmartsheetEPRTrackerRow, EPRTrackerStatus, EPREmploymentStatus, EPRProbationQuarter
 
 import box as box_helper
@@ -18,7 +22,8 @@ import box as box_helper
 sys.path.append("../layers/shared/python/")  # Necessary for DEV staging. AWS auto imports this file
 from shared_config.constants import Settings
 from shared_config.config import Config
-from api import get_smartsheet_client, get_box_client
+from api import get_smartsheet_client, get_box_client, update_rows_in_batches, SMARTSHEET_ROWS_BATCH_SIZE
+from concurrency import run_concurrently, MAX_WORKERS
 
 """
 Script that:
@@ -42,16 +47,8 @@ if Settings.STAGE == Settings.Stage.DEV:
     logger.addHandler(logger_stream_handler)
 
 
-error_map = defaultdict(list)  # Will email to someone to fix manually
-"""
-error_map = {
-    '$row_id': ['ERROR_MESSAGES']
-}
-"""
-
 DATE_FORMAT = "%Y-%m-%d"
-
-load_dotenv()
+SMARTSHEET_GET_SHEET_EXCLUDE = ["nonexistentCells", "linkInFromCellDetails", "linksOutToCellsDetails"]  # Cell details the script never reads
 
 
 def get_rows_awaiting_saving(sheet_client: Sheets) -> list[SmartsheetEPRTrackerRow]:
@@ -65,17 +62,23 @@ def get_rows_awaiting_saving(sheet_client: Sheets) -> list[SmartsheetEPRTrackerR
         list[SmartsheetEPRTrackerRow] or raise Smartsheet Error
     """
 
-    sheet:Sheets = sheet_client.get_sheet(Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID)
-    smartsheet_rows = SmartsheetEPRTrackerRow.parse_smartsheet_epr_tracker_table(sheet)
-    filtered_smartsheet_rows = list(filter(lambda x: x.status == EPRTrackerStatus.SAVING_TO_BOX, smartsheet_rows))
+    # Only the columns SmartsheetEPRTrackerRow reads, the rest of the sheet is never used here
+    sheet:Sheets = sheet_client.get_sheet(
+        Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID,
+        column_ids=list(SmartsheetEPRTrackerRow.COLUMN_ID_TO_KEY_MAP),
+        exclude=SMARTSHEET_GET_SHEET_EXCLUDE
+    )
+    filtered_smartsheet_rows = SmartsheetEPRTrackerRow.parse_smartsheet_epr_tracker_table(sheet, status=EPRTrackerStatus.SAVING_TO_BOX)
     return filtered_smartsheet_rows
 
-def save_epr_attachments_to_box(smartsheet_attachments_client: Attachments, filtered_rows: list[SmartsheetEPRTrackerRow], error_map: dict):
+def save_epr_attachments_to_box(smartsheet_attachments_client: Attachments, smartsheet_discussions_client: Discussions, box_client: BoxClient, filtered_rows: list[SmartsheetEPRTrackerRow], error_map: dict):
     """
     Save all the filtered row's attachements in to Box
     
     Args:
         smartsheet_attachments_client: Smartsheet's Attachment SDK object
+        smartsheet_discussions_client: Smartsheet's Discussions SDK object, used to find the row of comment attachments
+        box_client: Box SDK client shared by every upload
         filtered_rows: Smartsheet Employees sheet rows that status == 'Saving to Box'
         error_map: carries errors for each row if any occurs
     
@@ -88,19 +91,44 @@ def save_epr_attachments_to_box(smartsheet_attachments_client: Attachments, filt
     NO_ATTACHMENT_ERROR_MESSAGE = "Must have atleast 1 EPR attached"
     ATTACHMENT_FILE_ALREADY_EXISTS_ERROR_MESSAGE = "Attachment already exists in Box"
     ATTACHMENT_UNKNOWN_ERROR_MESSAGE = "Attachment failed to upload to Box for an unknown reason"
+    TODAYS_DATE = date.today().strftime(DATE_FORMAT)
+    TOTAL_ROWS = len(filtered_rows)
+
+    # One request for every attachment on the sheet instead of listing each row's attachments separately
+    response: IndexResult = smartsheet_attachments_client.list_all_attachments(Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID, include_all=True)
+    attachments = response.data
+
+    # Attachments added to a row's comments point at the comment, so map each comment back to its row
+    comment_row_id_map = {}
+    if any(attachment.parent_type == "COMMENT" for attachment in attachments):
+        response: IndexResult = smartsheet_discussions_client.get_all_discussions(Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID, include="comments", include_all=True)
+        for discussion in response.data:
+            if discussion.parent_type == "ROW":
+                for comment in discussion.comments:
+                    comment_row_id_map[comment.id_] = discussion.parent_id
+
+    row_attachments_map = defaultdict(list)
+    for attachment in attachments:
+        if attachment.parent_type == "ROW":
+            row_id = attachment.parent_id
+        elif attachment.parent_type == "COMMENT" and attachment.parent_id in comment_row_id_map:
+            row_id = comment_row_id_map[attachment.parent_id]
+        else:
+            continue
+        row_attachments_map[str(row_id)].append(attachment)  # Keyed like SmartsheetEPRTrackerRow.row_id, which is a str
 
-    for idx, row in enumerate(filtered_rows):
+    def save_row_attachment_to_box(idx: int, row: SmartsheetEPRTrackerRow) -> str | None:
+        """
+        Uploads the row's latest attachment to Box. Returns the row's error message, or None when it was saved.
+        """
         row_id = row.row_id
 
         # [ASK] - Upload all attachments? Or just the latest one?
-        response: IndexResult = smartsheet_attachments_client.list_row_attachments(Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID, row_id)
-        attachments = response.data
-        if len(attachments) == 0:
-            error_map[row_id].append(NO_ATTACHMENT_ERROR_MESSAGE)
-            continue
+        attachments = row_attachments_map.get(row_id)
+        if not attachments:
+            return NO_ATTACHMENT_ERROR_MESSAGE
 
-        attachments.sort(key=lambda x: x.created_at)  # Sort by attachment added date
-        latest_attachment: Attachment = attachments[-1]
+        latest_attachment: Attachment = max(attachments, key=lambda x: x.created_at)  # Most recently added attachment
         attachment_id = latest_attachment.id
 
         # Have to manually fetch AGAIN the attachment because of a bug where listing attachments
@@ -108,25 +136,33 @@ def save_epr_attachments_to_box(smartsheet_attachments_client: Attachments, filt
         attachment: Attachment = smartsheet_attachments_client.get_attachment(Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID, attachment_id)
         
         # Parse the columns. Will need to update columns if columns are ever increased/decreased.
-        today_string = date.today().strftime(DATE_FORMAT)
-        filename = f"{today_string}-{row.last_name}-{row.first_name}.pdf"
+        filename = f"{TODAYS_DATE}-{row.last_name}-{row.first_name}.pdf"
 
         # Use box helper to upload attachment from Smartsheet to Box
-        counter = f"{idx+1}/{len(filtered_rows)}"
+        counter = f"{idx+1}/{TOTAL_ROWS}"
         try:
-            uploaded_file = box_helper.upload_file_to_box_by_url(attachment.url, filename)
-            logger.info(f"✅ ({counter}) File uploaded successfully!")
-            logger.info(f"  File ID: {uploaded_file.id}")
-            logger.info(f"  File Name: {uploaded_file.name}")
-            logger.info(f"  File URL: https://app.box.com/file/{uploaded_file.id}")
+            uploaded_file = box_helper.upload_file_to_box_by_url(attachment.url, filename, client=box_client)
+            # One log call so lines from concurrent uploads don't interleave
+            logger.info(
+                f"✅ ({counter}) File uploaded successfully!\n"
+                f"  File ID: {uploaded_file.id}\n"
+                f"  File Name: {uploaded_file.name}\n"
+                f"  File URL: https://app.box.com/file/{uploaded_file.id}"
+            )
         except FileExistsError as err:
             logger.warning(f"🚧 ({counter}) Error: {err}")
-            error_map[row_id].append(ATTACHMENT_FILE_ALREADY_EXISTS_ERROR_MESSAGE)
+            return ATTACHMENT_FILE_ALREADY_EXISTS_ERROR_MESSAGE
         except RuntimeError as err:
             raise err
         except Exception as err:
             logger.warning(f"🚧 ({counter}) Error uploading file: {err}")
-            error_map[row_id].append(ATTACHMENT_UNKNOWN_ERROR_MESSAGE)
+            return ATTACHMENT_UNKNOWN_ERROR_MESSAGE
+        return None
+
+    # Rows are independent, so they are saved concurrently. error_map is only written from this thread.
+    for (idx, row), error_message in run_concurrently(save_row_attachment_to_box, enumerate(filtered_rows)):
+        if error_message:
+            error_map[row.row_id].append(error_message)
 
 def copy_smartsheet_rows_to_history_table(sheet_client: Sheets, filtered_rows: list[SmartsheetEPRTrackerRow], error_map: dict):
     """
@@ -144,35 +180,44 @@ def copy_smartsheet_rows_to_history_table(sheet_client: Sheets, filtered_rows: l
         RuntimeError: If there is an error copying a row
     """
     COPY_SMARTSHEET_ROW_ERROR_MESSAGE = "Row failed to be saved in the history table"
+    TOTAL_ROWS = len(filtered_rows)
 
-    for idx,row in enumerate(filtered_rows):
-        row_id = row.row_id
-        first_name = row.first_name.upper()
-        last_name = row.last_name.upper()
-
-        # We don't want rows that previously have had errors.
-        if row_id in error_map:
-            continue
+    # We don't want rows that previously have had errors.
+    rows_to_copy = [(idx, row) for idx, row in enumerate(filtered_rows) if row.row_id not in error_map]
 
-        try:
-            copy_request = smartsheet.models.CopyOrMoveRowDirective({
-                "row_ids": [row_id],
-                "to": smartsheet.models.CopyOrMoveRowDestination({
-                    "sheet_id": Config.EPRTracker.Smartsheet.EPR_TRACKER_HISTORY_TABLE_ID
-                })
+    def copy_rows_to_history_table(batch: list[tuple[int, SmartsheetEPRTrackerRow]]):
+        copy_request = smartsheet.models.CopyOrMoveRowDirective({
+            "row_ids": [int(row.row_id) for _, row in batch],
+            "to": smartsheet.models.CopyOrMoveRowDestination({
+                "sheet_id": Config.EPRTracker.Smartsheet.EPR_TRACKER_HISTORY_TABLE_ID
             })
-
-            sheet_client.copy_rows(
-                Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID,
-                copy_request
-            )
-
-            counter = f"{idx+1}/{len(filtered_rows)}"
-            logger.info(f"✅ ({counter}) Row successfully copied to history table for {first_name} {last_name}")
+        })
+
+        response = sheet_client.copy_rows(
+            Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID,
+            copy_request
+        )
+        if isinstance(response, Error):
+            raise RuntimeError(response.result.message)
+
+    # One copy_rows request per batch instead of one per row. Smartsheet copies a batch all or nothing, so a failed
+    # batch is copied again one row at a time to only mark the rows that actually fail.
+    batches = [rows_to_copy[i:i + SMARTSHEET_ROWS_BATCH_SIZE] for i in range(0, len(rows_to_copy), SMARTSHEET_ROWS_BATCH_SIZE)]
+    while batches:
+        batch = batches.pop(0)
+        try:
+            copy_rows_to_history_table(batch)
+            for idx, row in batch:
+                logger.info(f"✅ ({idx+1}/{TOTAL_ROWS}) Row successfully copied to history table for {row.first_name.upper()} {row.last_name.upper()}")
         except Exception:
-            counter = f"{idx+1}/{len(filtered_rows)}"
-            logger.exception(f"🚧 ({counter}) Error saving row to history table for {first_name} {last_name}")
-            error_map[row_id].append(COPY_SMARTSHEET_ROW_ERROR_MESSAGE)
+            if len(batch) > 1:
+                logger.warning(f"🚧 Error saving {len(batch)} row(s) to history table, copying them one at a time")
+                batches[0:0] = [[item] for item in batch]
+                continue
+
+            idx, row = batch[0]
+            logger.exception(f"🚧 ({idx+1}/{TOTAL_ROWS}) Row not saved to history table for {row.first_name.upper()} {row.last_name.upper()}")
+            error_map[row.row_id].append(COPY_SMARTSHEET_ROW_ERROR_MESSAGE)
         
 def reset_columns_for_next_epr_due_date(sheet_client: Sheets, smartsheet_attachments_client: Attachments, filtered_rows: list[SmartsheetEPRTrackerRow], error_map: dict):
     """
@@ -205,6 +250,27 @@ def reset_columns_for_next_epr_due_date(sheet_client: Sheets, smartsheet_attachm
         EPRProbationQuarter.Q1,
         EPRProbationQuarter.Q2
     ]
+    # Flex probation's quarters are the first of the regular ones, so both share these positions
+    PROBATION_QUARTER_POSITIONS = {quarter: position for position, quarter in enumerate(PROBATION_STATUS_QUARTER_VALUES)}
+    # {employment status: (probation quarters in order, months until their next EPR)}
+    PROBATION_SCHEDULES = {
+        EPREmploymentStatus.PROBATIONARY: (PROBATION_STATUS_QUARTER_VALUES, 3),
+        EPREmploymentStatus.FLEX_PROBATIONARY: (FLEX_PROBATION_STATUS_QUARTER_VALUES, 6)
+    }
+
+    def delete_row_attachments(row_id: int):
+        """
+        Deletes every attachment on the row, including ones added to its comments.
+        """
+        attachments = smartsheet_attachments_client.list_row_attachments(Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID, row_id).data
+        for attachment in attachments:
+            response = smartsheet_attachments_client.delete_attachment(Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID, attachment.id)
+            if isinstance(response, Error):
+                raise RuntimeError(response.result.message)
+            logger.info(f"  attachment: {attachment.name} successfully deleted")
+
+    rows_to_reset: list[smartsheet.models.Row] = []
+    reset_rows_map = {}  # {smartsheet row id: (idx, SmartsheetEPRTrackerRow)} for rows waiting on the batched update
 
     for idx,row in enumerate(filtered_rows):
         row_id = row.row_id
@@ -234,9 +300,10 @@ def reset_columns_for_next_epr_due_date(sheet_client: Sheets, smartsheet_attachm
             #   +6 months if flex probation
             #   +3 months if probation
             if employment_status == EPREmploymentStatus.YEARLY:
-                updated_epr_due_date = updated_epr_due_date.replace(year=updated_epr_due_date.year + 1)
-            elif employment_status == EPREmploymentStatus.FLEX_PROBATIONARY:
-                if probation_quarter not in FLEX_PROBATION_STATUS_QUARTER_VALUES:
+                updated_epr_due_date += relativedelta(years=1)
+            elif employment_status in PROBATION_SCHEDULES:
+                probation_quarters, months_between_eprs = PROBATION_SCHEDULES[employment_status]
+                if probation_quarter not in probation_quarters:
                     if probation_quarter in PROBATION_STATUS_QUARTER_VALUES:
                         logger.warning(f"🚧 Error resetting row for {row.first_name} {row.last_name}. Probation quarter value can not be 3Q or 4Q")
                     else:
@@ -245,9 +312,9 @@ def reset_columns_for_next_epr_due_date(sheet_client: Sheets, smartsheet_attachm
                     error_map[row_id].append(MISSING_PROBATION_QUARTER_ERROR_MESSAGE)
                     continue
 
-                probation_quarter_position = PROBATION_STATUS_QUARTER_VALUES.index(probation_quarter)
-                if probation_quarter_position+1 == len(FLEX_PROBATION_STATUS_QUARTER_VALUES):  # Take them off probation
-                    updated_epr_due_date = updated_epr_due_date.replace(year=updated_epr_due_date.year + 1)
+                probation_quarter_position = PROBATION_QUARTER_POSITIONS[probation_quarter]
+                if probation_quarter_position+1 == len(probation_quarters):  # Take them off probation
+                    updated_epr_due_date += relativedelta(years=1)
                     # Change to yearly employment status and set their probartion quarter to "N/A"
                     cells_to_update.append(smartsheet.models.Cell({
                         "column_id": Config.EPRTracker.Smartsheet.EMPLOYMENT_STATUS_COLUMN_ID,
@@ -258,42 +325,11 @@ def reset_columns_for_next_epr_due_date(sheet_client: Sheets, smartsheet_attachm
                         "value": EPRProbationQuarter.NA.value
                     }))
                 else:
-                    updated_month_value = updated_epr_due_date.month + 6
-                    if updated_month_value > 12:
-                        updated_month_value %= 12
-                    updated_epr_due_date = updated_epr_due_date.replace(month=updated_month_value)
+                    updated_epr_due_date += relativedelta(months=months_between_eprs)  # Rolls into next year, clamps to the month's last day
                     # Increment their probation quarter by 1
                     cells_to_update.append(smartsheet.models.Cell({
                         "column_id": Config.EPRTracker.Smartsheet.PROBATION_QUARTER_COLUMN_ID,
-                        "value": FLEX_PROBATION_STATUS_QUARTER_VALUES[probation_quarter_position+1].value
-                    }))
-            elif employment_status == EPREmploymentStatus.PROBATIONARY:
-                if probation_quarter not in PROBATION_STATUS_QUARTER_VALUES:
-                    logger.warning(f"🚧 Error resetting row for {row.first_name} {row.last_name}. Missing probation quarter value")
-                    error_map[row_id].append(MISSING_PROBATION_QUARTER_ERROR_MESSAGE)
-                    continue
-
-                probation_quarter_position = PROBATION_STATUS_QUARTER_VALUES.index(probation_quarter)
-                if probation_quarter_position+1 == len(PROBATION_STATUS_QUARTER_VALUES):  # Take them off probation
-                    updated_epr_due_date = updated_epr_due_date.replace(year=updated_epr_due_date.year + 1)
-                    # Change to yearly employment status and set their probartion quarter to "N/A"
-                    cells_to_update.append(smartsheet.models.Cell({
-                        "column_id": Config.EPRTracker.Smartsheet.EMPLOYMENT_STATUS_COLUMN_ID,
-                        "value": EPREmploymentStatus.YEARLY.value
-                    }))
-                    cells_to_update.append(smartsheet.models.Cell({
-                        "column_id": Config.EPRTracker.Smartsheet.PROBATION_QUARTER_COLUMN_ID,
-                        "value": EPRProbationQuarter.NA.value
-                    }))
-                else:
-                    updated_month_value = updated_epr_due_date.month + 3
-                    if updated_month_value > 12:
-                        updated_month_value %= 12
-                    updated_epr_due_date = updated_epr_due_date.replace(month=updated_month_value)
-                    # Increment their probation quarter by 1
-                    cells_to_update.append(smartsheet.models.Cell({
-                        "column_id": Config.EPRTracker.Smartsheet.PROBATION_QUARTER_COLUMN_ID,
-                        "value": PROBATION_STATUS_QUARTER_VALUES[probation_quarter_position+1].value
+                        "value": probation_quarters[probation_quarter_position+1].value
                     }))
             else:
                 logger.warning(f"🚧 Error resetting row for {row.first_name} {row.last_name}. Missing employment status value")
@@ -323,32 +359,54 @@ def reset_columns_for_next_epr_due_date(sheet_client: Sheets, smartsheet_attachm
                 "cells": cells_to_update
             })
 
-            # Delete all attachments in the row
-            attachments = smartsheet_attachments_client.list_row_attachments(Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID, row_id).data
-            for attachment in attachments:
-                logger.info(f"  attachment: {attachment.name} successfully deleted")
-                smartsheet_attachments_client.delete_attachment(Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID, attachment.id)
-
-            response = sheet_client.update_rows(Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID, [row_to_update])
-
-            if isinstance(response, Error):
-                raise RuntimeError(response.result.message)
-
-            counter = f"{idx+1}/{len(filtered_rows)}"
-            logger.info(f"✅ ({counter}) Successfully reset row for {row.first_name} {row.last_name}")
+            rows_to_reset.append(row_to_update)
+            reset_rows_map[row_to_update.id] = (idx, row)
         except Exception:
             counter = f"{idx+1}/{len(filtered_rows)}"
             logger.exception(f"🚧 ({counter}) Error resetting row for {row.first_name} {row.last_name}")
             error_map[row_id].append(RESETTING_SMARTSHEET_ROW_ERROR_MESSAGE)
 
+    # Delete all attachments in each row before it is reset. Rows are independent, so their deletes run concurrently.
+    rows_to_update: list[smartsheet.models.Row] = []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(delete_row_attachments, row_to_update.id): row_to_update for row_to_update in rows_to_reset}
+        for future in as_completed(futures):
+            row_to_update = futures[future]
+            try:
+                future.result()
+                rows_to_update.append(row_to_update)
+            except Exception:
+                idx, row = reset_rows_map.pop(row_to_update.id)
+                logger.exception(f"🚧 ({idx+1}/{len(filtered_rows)}) Error deleting attachments for {row.first_name} {row.last_name}")
+                error_map[row.row_id].append(RESETTING_SMARTSHEET_ROW_ERROR_MESSAGE)
+
+    # Every reset row is saved together instead of one update_rows request per row
+    failed_row_ids = set(update_rows_in_batches(sheet_client, Config.EPRTracker.Smartsheet.EPR_TRACKER_TABLE_ID, rows_to_update))
+    for smartsheet_row_id, (idx, row) in reset_rows_map.items():
+        counter = f"{idx+1}/{len(filtered_rows)}"
+        if smartsheet_row_id in failed_row_ids:
+            logger.warning(f"🚧 ({counter}) Error resetting row for {row.first_name} {row.last_name}")
+            error_map[row.row_id].append(RESETTING_SMARTSHEET_ROW_ERROR_MESSAGE)
+        else:
+            logger.info(f"✅ ({counter}) Successfully reset row for {row.first_name} {row.last_name}")
+
 
 def main():
+    # Created per run, a warm Lambda container would otherwise carry the previous run's errors into this one
+    error_map = defaultdict(list)  # Will email to someone to fix manually
+    """
+    error_map = {
+        '$row_id': ['ERROR_MESSAGES']
+    }
+    """
+
     # Get Smartsheet Client
     try:
         logger.info(f"🤖 Fetching Smartsheet Client...")
         smartsheet_client: Smartsheet = get_smartsheet_client()
         sheet_client: Sheets = Sheets(smartsheet_client)
         smartsheet_attachments_object: Attachments = Attachments(smartsheet_client)
+        smartsheet_discussions_object: Discussions = Discussions(smartsheet_client)
         logger.info(f"✅ Successfully found a valid Smartsheet Client...")
     except RuntimeError:
         logger.exception("\n❌ Failed to fetch smartsheet client...")
@@ -369,7 +427,8 @@ def main():
     # Send/save EPR attachment(s) to Box
     try:
         logger.info(f"📦 Saving {len(filtered_rows)} EPR attachment(s) to Box")
-        save_epr_attachments_to_box(smartsheet_attachments_object, filtered_rows, error_map)
+        box_client: BoxClient = get_box_client()  # Authenticated once instead of once per uploaded EPR
+        save_epr_attachments_to_box(smartsheet_attachments_object, smartsheet_discussions_object, box_client, filtered_rows, error_map)
 
         if error_map:
             logger.warning(f"🚧 ({len(error_map)} of {len(filtered_rows)}) EPRs had some errors. Sending errors to designated email... ")
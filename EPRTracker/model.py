@@ -46,6 +46,19 @@ class EPRProbationQuarter(Enum):
     NA = "N/A"
 
 class SmartsheetEPRTrackerRow:
+    # Maps Smartsheet column ids to SmartsheetEPRTrackerRow class attribute names. These are the only columns read from the sheet.
+    COLUMN_ID_TO_KEY_MAP = {
+        Config.EPRTracker.Smartsheet.STATUS_COLUMN_ID: "status",
+        Config.EPRTracker.Smartsheet.FIRST_NAME_COLUMN_ID: "first_name",
+        Config.EPRTracker.Smartsheet.LAST_NAME_COLUMN_ID: "last_name",
+        Config.EPRTracker.Smartsheet.JOB_CLASS_COLUMN_ID: "job_class",
+        Config.EPRTracker.Smartsheet.EMPLOYMENT_STATUS_COLUMN_ID: "employment_status",
+        Config.EPRTracker.Smartsheet.PROBATION_QUARTER_COLUMN_ID: "probation_quarter",
+        Config.EPRTracker.Smartsheet.SIGNED_EPR_DUE_DATE_COLUMN_ID: "signed_epr_due_date",
+        Config.EPRTracker.Smartsheet.PREVIOUS_EPR_SIGNED_DATE_COLUMN_ID: "previous_epr_signed_date",
+        Config.EPRTracker.Smartsheet.PREVIOUS_EPR_ACTUAL_DUE_DATE_COLUMN_ID: "previous_epr_actual_due_date"
+    }
+
     def __init__(self,
                 table_id: str,
                 row_id: str,
@@ -90,8 +103,9 @@ class SmartsheetEPRTrackerRow:
                 pass
 
             # Fallback: match by enum name (case-insensitive)
+            folded_value = value.casefold()
             for member in target_type:
-                if member.name.lower() == value.lower():
+                if member.name.casefold() == folded_value:
                     return member
 
             raise ValueError(
@@ -117,12 +131,13 @@ class SmartsheetEPRTrackerRow:
         raise TypeError("target_type must be str, Enum, or date subclass")
 
     @staticmethod
-    def parse_smartsheet_epr_tracker_table(smartsheet_sheet_data: Sheet):
+    def parse_smartsheet_epr_tracker_table(smartsheet_sheet_data: Sheet, status: EPRTrackerStatus = None):
         """
         Takes in json data response from Smartsheet's Sheet object and returns a list of SmartsheetEPRTrackerRow objects filled out with their proper data.
 
         Args:
             smartsheet_sheet_data: Smartsheet's Sheet object.
+            status: When given, only rows with this status are validated and returned.
 
         Returns:
             list[SmartsheetEPRTrackerRow]
@@ -130,20 +145,7 @@ class SmartsheetEPRTrackerRow:
         if not isinstance(smartsheet_sheet_data, Sheet):
             raise ValueError(f"smartsheet_sheet_data must be of type 'smartsheet.models.sheet.Sheet', not {type(smartsheet_sheet_data)}.")
 
-        # Maps Smartsheet column ids to SmartsheetEPRTrackerRow class attribute names.
-        column_id_to_key_map = {
-            Config.EPRTracker.Smartsheet.STATUS_COLUMN_ID: "status",
-            Config.EPRTracker.Smartsheet.FIRST_NAME_COLUMN_ID: "first_name",
-            Config.EPRTracker.Smartsheet.LAST_NAME_COLUMN_ID: "last_name",
-            Config.EPRTracker.Smartsheet.JOB_CLASS_COLUMN_ID: "job_class",
-            Config.EPRTracker.Smartsheet.EMPLOYMENT_STATUS_COLUMN_ID: "employment_status",
-            Config.EPRTracker.Smartsheet.PROBATION_QUARTER_COLUMN_ID: "probation_quarter",
-            Config.EPRTracker.Smartsheet.SIGNED_EPR_DUE_DATE_COLUMN_ID: "signed_epr_due_date",
-            Config.EPRTracker.Smartsheet.PREVIOUS_EPR_SIGNED_DATE_COLUMN_ID: "previous_epr_signed_date",
-            Config.EPRTracker.Smartsheet.PREVIOUS_EPR_ACTUAL_DUE_DATE_COLUMN_ID: "previous_epr_actual_due_date"
-        }
-
-        required_columns = set(column_id_to_key_map.values())
+        required_columns = set(SmartsheetEPRTrackerRow.COLUMN_ID_TO_KEY_MAP.values())
 
         resulting_rows:list[SmartsheetEPRTrackerRow] = []
         for row in smartsheet_sheet_data.rows:
@@ -154,9 +156,18 @@ class SmartsheetEPRTrackerRow:
             for cell in row.cells:
                 assert isinstance(cell, Cell), f"Expected smartsheet.models.cell.Cell, but got {type(cell)}"
 
-                if cell.column_id in column_id_to_key_map:
-                    values.setdefault(column_id_to_key_map[cell.column_id], cell.value)
-
+                if cell.column_id in SmartsheetEPRTrackerRow.COLUMN_ID_TO_KEY_MAP:
+                    values.setdefault(SmartsheetEPRTrackerRow.COLUMN_ID_TO_KEY_MAP[cell.column_id], cell.value)
+
+            # Skip other rows before validating/converting them, most of the sheet isn't in the requested status.
+            # The status is coerced like below, so it also matches by enum name.
+            if status is not None:
+                try:
+                    row_status = SmartsheetEPRTrackerRow._coerce_value(values["status"], EPRTrackerStatus) if values.get("status") else None
+                except ValueError:
+                    row_status = None
+                if row_status is not status:
+                    continue
 
             missing_columns = [col_name for col_name in required_columns if not values.get(col_name)]
             if len(missing_columns) > 0:
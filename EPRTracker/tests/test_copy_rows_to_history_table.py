@@ -0,0 +1,53 @@
+import sys
+import unittest
+from collections import defaultdict
+from pathlib import Path
+from types import SimpleNamespace
+
+EPR_TRACKER_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(EPR_TRACKER_DIR))
+sys.path.insert(0, str(EPR_TRACKER_DIR.parent / "layers" / "shared" / "python"))
+
+from smartsheet.models import Error
+
+import main
+
+
+class FakeSheetClient:
+    def __init__(self, bad_row_ids: set):
+        self.bad_row_ids = bad_row_ids
+        self.copy_rows_calls = []
+
+    def copy_rows(self, sheet_id, copy_request):
+        row_ids = list(copy_request.row_ids)
+        self.copy_rows_calls.append(row_ids)
+        if self.bad_row_ids.intersection(row_ids):
+            return Error({"result": {"message": "Row can not be copied"}})
+        return SimpleNamespace()
+
+
+def make_row(row_id: int):
+    return SimpleNamespace(row_id=str(row_id), first_name="Jane", last_name=f"Doe{row_id}")
+
+
+class CopySmartsheetRowsToHistoryTableTest(unittest.TestCase):
+    def test_rows_are_copied_in_one_batch(self):
+        sheet_client = FakeSheetClient(set())
+        error_map = defaultdict(list)
+        main.copy_smartsheet_rows_to_history_table(sheet_client, [make_row(1), make_row(2)], error_map)
+
+        self.assertEqual(sheet_client.copy_rows_calls, [[1, 2]])
+        self.assertFalse(error_map)
+
+    def test_failed_batch_only_marks_the_bad_row(self):
+        sheet_client = FakeSheetClient({2})
+        error_map = defaultdict(list)
+        with self.assertLogs(main.logger, "WARNING"):
+            main.copy_smartsheet_rows_to_history_table(sheet_client, [make_row(1), make_row(2), make_row(3)], error_map)
+
+        self.assertEqual(sheet_client.copy_rows_calls, [[1, 2, 3], [1], [2], [3]])
+        self.assertEqual(list(error_map), ["2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
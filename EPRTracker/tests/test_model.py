@@ -0,0 +1,47 @@
+import sys
+import unittest
+from pathlib import Path
+
+EPR_TRACKER_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(EPR_TRACKER_DIR))
+sys.path.insert(0, str(EPR_TRACKER_DIR.parent / "layers" / "shared" / "python"))
+
+from smartsheet.models import Sheet
+
+from model import SmartsheetEPRTrackerRow, EPRTrackerStatus
+
+ROW_VALUES = {
+    "first_name": "Jane",
+    "last_name": "Doe",
+    "job_class": "Clerk",
+    "employment_status": "yearly",
+    "probation_quarter": "Q1",
+    "signed_epr_due_date": "2025-01-01",
+    "previous_epr_signed_date": "2024-01-01",
+    "previous_epr_actual_due_date": "2024-01-01",
+}
+
+
+def make_sheet(*statuses: str) -> Sheet:
+    key_to_column_id = {key: column_id for column_id, key in SmartsheetEPRTrackerRow.COLUMN_ID_TO_KEY_MAP.items()}
+    rows = [
+        {
+            "id": row_id,
+            "cells": [{"columnId": key_to_column_id[key], "value": value} for key, value in {**ROW_VALUES, "status": status}.items()]
+        }
+        for row_id, status in enumerate(statuses, start=1)
+    ]
+    return Sheet({"id": 1, "rows": rows})
+
+
+class ParseSmartsheetEPRTrackerTableTest(unittest.TestCase):
+    def test_status_filter_matches_enum_values_and_names(self):
+        sheet = make_sheet("Saving to Box", "saving_to_box", "With HR", "Unknown")
+        rows = SmartsheetEPRTrackerRow.parse_smartsheet_epr_tracker_table(sheet, status=EPRTrackerStatus.SAVING_TO_BOX)
+
+        self.assertEqual([row.row_id for row in rows], ["1", "2"])
+        self.assertTrue(all(row.status is EPRTrackerStatus.SAVING_TO_BOX for row in rows))
+
+
+if __name__ == "__main__":
+    unittest.main()
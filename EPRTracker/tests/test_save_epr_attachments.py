@@ -0,0 +1,91 @@
+import sys
+import unittest
+from unittest import mock
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+EPR_TRACKER_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(EPR_TRACKER_DIR))
+sys.path.insert(0, str(EPR_TRACKER_DIR.parent / "layers" / "shared" / "python"))
+
+import main
+
+
+class FakeAttachmentsClient:
+    def __init__(self, attachments):
+        self.attachments = attachments
+        self.list_row_attachments_calls = []
+
+    def list_all_attachments(self, sheet_id, include_all=None):
+        return SimpleNamespace(data=self.attachments)
+
+    def list_row_attachments(self, sheet_id, row_id):
+        self.list_row_attachments_calls.append(row_id)
+        return SimpleNamespace(data=[])
+
+    def get_attachment(self, sheet_id, attachment_id):
+        return SimpleNamespace(id=attachment_id, url=f"https://s3.example.com/{attachment_id}")
+
+
+class FakeDiscussionsClient:
+    def __init__(self, discussions):
+        self.discussions = discussions
+        self.calls = 0
+
+    def get_all_discussions(self, sheet_id, include=None, include_all=None):
+        self.calls += 1
+        return SimpleNamespace(data=self.discussions)
+
+
+def make_row(row_id: int):
+    return SimpleNamespace(row_id=str(row_id), first_name="Jane", last_name=f"Doe{row_id}")
+
+
+class SaveEPRAttachmentsToBoxTest(unittest.TestCase):
+    def save(self, attachments: list, discussions: list, rows: list):
+        self.attachments_client = FakeAttachmentsClient(attachments)
+        self.discussions_client = FakeDiscussionsClient(discussions)
+        self.uploaded_urls = []
+        def fake_upload(s3_url, filename, client=None):
+            self.uploaded_urls.append(s3_url)
+            return SimpleNamespace(id=len(self.uploaded_urls), name=filename)
+
+        error_map = defaultdict(list)
+        with mock.patch.object(main.box_helper, "upload_file_to_box_by_url", fake_upload):
+            main.save_epr_attachments_to_box(self.attachments_client, self.discussions_client, None, rows, error_map)
+        return error_map
+
+    def test_sheet_attachments_are_matched_to_rows_without_per_row_listing(self):
+        # parent_id is an int from the SDK, while SmartsheetEPRTrackerRow.row_id is a str
+        attachments = [
+            SimpleNamespace(id=101, parent_id=1, parent_type="ROW", created_at=datetime(2025, 1, 1)),
+            SimpleNamespace(id=102, parent_id=1, parent_type="ROW", created_at=datetime(2025, 2, 1)),
+            SimpleNamespace(id=201, parent_id=2, parent_type="ROW", created_at=datetime(2025, 1, 1)),
+        ]
+        error_map = self.save(attachments, [], [make_row(1), make_row(2)])
+
+        self.assertEqual(self.attachments_client.list_row_attachments_calls, [])
+        self.assertEqual(self.discussions_client.calls, 0)
+        self.assertEqual(sorted(self.uploaded_urls), ["https://s3.example.com/102", "https://s3.example.com/201"])
+        self.assertFalse(error_map)
+
+    def test_newer_comment_attachment_is_picked_over_row_attachment(self):
+        attachments = [
+            SimpleNamespace(id=101, parent_id=1, parent_type="ROW", created_at=datetime(2025, 1, 1)),
+            SimpleNamespace(id=102, parent_id=900, parent_type="COMMENT", created_at=datetime(2025, 2, 1)),
+            SimpleNamespace(id=201, parent_id=901, parent_type="COMMENT", created_at=datetime(2025, 1, 1)),
+        ]
+        discussions = [
+            SimpleNamespace(parent_id=1, parent_type="ROW", comments=[SimpleNamespace(id_=900)]),
+            SimpleNamespace(parent_id=2, parent_type="ROW", comments=[SimpleNamespace(id_=901)]),
+        ]
+        error_map = self.save(attachments, discussions, [make_row(1), make_row(2)])
+
+        self.assertEqual(sorted(self.uploaded_urls), ["https://s3.example.com/102", "https://s3.example.com/201"])
+        self.assertFalse(error_map)
+
+
+if __name__ == "__main__":
+    unittest.main()
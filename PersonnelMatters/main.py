@@ -2,15 +2,13 @@ import logging
 import sys
 from pathlib import Path
 from datetime import date
-import requests
 from io import BytesIO
 
 import smartsheet
 from smartsheet.sheets import Sheets
-from smartsheet.models import Sheet, Attachment
+from smartsheet.models import Sheet, Row, Cell, Attachment
 from smartsheet.smartsheet import Smartsheet
 from smartsheet.attachments import Attachments
-from smartsheet.models.index_result import IndexResult
 
 from box_sdk_gen import BoxClient
 from box_sdk_gen.schemas import FolderFull, Files
@@ -20,10 +18,13 @@ from box_sdk_gen.managers.uploads import UploadFileAttributes, UploadFileAttribu
 BASE_DIR = Path(__file__).resolve().parents[1]
 sys.path.append(str(BASE_DIR / "layers" / "shared" / "python"))
 
-from api import get_smartsheet_client, get_box_client
+from api import get_smartsheet_client, get_box_client, get_s3_download_session, S3_DOWNLOAD_TIMEOUT_SECONDS
+from concurrency import run_concurrently
 from shared_config.constants import Settings, Constants
 from shared_config.config import Config
 
+s3_session = get_s3_download_session()  # Reused across attachments
+
 logger = logging.getLogger("personnel_matters")
 logger.setLevel(logging.INFO)
 
@@ -34,10 +35,25 @@ if Settings.STAGE == Settings.Stage.DEV and not logger.handlers:
 
 
 class PersonnelMattersRow:
-    def __init__(self, row_id: int, personnel_matters_id: str, respondent: str):
+    def __init__(self, row_id: int, personnel_matters_id: str, respondent: str, attachments: list[Attachment] | None = None):
         self.row_id = row_id
         self.personnel_matters_id = personnel_matters_id
         self.respondent = respondent
+        self.attachments = attachments  # Row and comment attachments listed with the sheet, their urls still have to be fetched
+
+def get_row_attachments(row: Row) -> list[Attachment]:
+    """
+    Returns every attachment on the row, including ones added to its comments, like list_row_attachments does.
+    `row` must come from a sheet fetched with include=["attachments", "discussions"].
+    """
+    attachments_map = {attachment.id: attachment for attachment in row.attachments}
+    for discussion in row.discussions:
+        for attachment in discussion.comment_attachments:
+            attachments_map.setdefault(attachment.id, attachment)
+        for comment in discussion.comments:
+            for attachment in comment.attachments:
+                attachments_map.setdefault(attachment.id, attachment)
+    return list(attachments_map.values())
 
 def get_smartsheet_rows_with_attachments(sheet_client: Sheets) -> list[PersonnelMattersRow]:
     SHEET_ID = Config.PersonnelMatters.Smartsheet.PERSONNEL_MATTERS_TABLE_ID
@@ -45,20 +61,22 @@ def get_smartsheet_rows_with_attachments(sheet_client: Sheets) -> list[Personnel
 
     valid_rows: list[PersonnelMattersRow] = []
 
-    sheet: Sheet = sheet_client.get_sheet(SHEET_ID)
+    # Lists every row's attachments, including ones added to its comments, in the same request
+    sheet: Sheet = sheet_client.get_sheet(SHEET_ID, include=["attachments", "discussions"])
     if not isinstance(sheet, Sheet):
         raise RuntimeError(f"Failed to fetch Smartsheet table with id: '{SHEET_ID}'")
     
-    rows = sheet.to_dict().get("rows", [])
+    # Reading the SDK models directly, sheet.to_dict() would serialize every cell of every row just to read 4 columns
+    rows = sheet.rows
     if not rows:
         raise RuntimeError("Failed to find any rows from Smartsheet table. Or Smartsheet table is empty.")
 
     for row in rows:
-        if not isinstance(row, dict):
+        if not isinstance(row, Row):
             logger.warning(f"Row in Smartsheet table with id: '{SHEET_ID}' is malformed.")
             continue
 
-        row_id = row.get("id")
+        row_id = row.id_
         if not row_id:
             logger.warning(f"Row in Smartsheet table with id: '{SHEET_ID}' is missing row id.")
             continue
@@ -68,50 +86,52 @@ def get_smartsheet_rows_with_attachments(sheet_client: Sheets) -> list[Personnel
         box_sync_status = None
         do_you_have_any_documents_status = None
 
-        cells = row.get("cells", [])
-        for cell in cells:
-            if not isinstance(cell, dict):
+        for cell in row.cells:
+            if not isinstance(cell, Cell):
                 continue
 
-            if cell.get("columnId") == Config.PersonnelMatters.Smartsheet.BOX_SYNC_STATUS_COLUMN_ID:
-                box_sync_status = cell.get("value")
-            elif cell.get("columnId") == Config.PersonnelMatters.Smartsheet.DO_YOU_HAVE_ANY_DOCUMENTS_COLUMN_ID:
-                do_you_have_any_documents_status = cell.get("value")
-            elif cell.get("columnId") == Config.PersonnelMatters.Smartsheet.MATTER_COLUMN_IDS:
-                personnel_matters_id = cell.get("value")
-            elif cell.get("columnId") == Config.PersonnelMatters.Smartsheet.RESPONDENT_COLUMN_ID:
-                respondent = cell.get("value")
+            column_id = cell.column_id
+            if column_id == Config.PersonnelMatters.Smartsheet.BOX_SYNC_STATUS_COLUMN_ID:
+                box_sync_status = cell.value
+            elif column_id == Config.PersonnelMatters.Smartsheet.DO_YOU_HAVE_ANY_DOCUMENTS_COLUMN_ID:
+                do_you_have_any_documents_status = cell.value
+            elif column_id == Config.PersonnelMatters.Smartsheet.MATTER_COLUMN_IDS:
+                personnel_matters_id = cell.value
+            elif column_id == Config.PersonnelMatters.Smartsheet.RESPONDENT_COLUMN_ID:
+                respondent = cell.value
 
         if box_sync_status == Constants.PersonnelMatters.Smartsheet.BOX_SYNC_PENDING_UPLOAD_STATUS and do_you_have_any_documents_status == "Yes":
-            valid_rows.append(PersonnelMattersRow(row_id, personnel_matters_id, respondent))
+            valid_rows.append(PersonnelMattersRow(row_id, personnel_matters_id, respondent, get_row_attachments(row)))
 
     logger.info(f"✅ Successfully found {len(valid_rows)} newly created rows that need to upload attachments.")
     return valid_rows
 
 def save_attachments_to_box(box_client: BoxClient, smartsheet_attachments_client: Attachments, personnelMattersRows: list[PersonnelMattersRow], failed_row_ids: set):
-    for idx, personnelMattersRow in enumerate(personnelMattersRows):
+    TODAYS_DATE = date.today().strftime(r"%Y-%m-%d")
+
+    def save_row_attachments_to_box(idx: int, personnelMattersRow: PersonnelMattersRow) -> bool:
+        """
+        Creates the row's Box folder and uploads every attachment into it. Returns True when any step failed.
+        """
         row_id = personnelMattersRow.row_id
 
         counter = f"({idx+1}/{len(personnelMattersRows)})"
         logger.info(f"{counter} Saving attachments for row with id: '{row_id}'...")
-        response: IndexResult = smartsheet_attachments_client.list_row_attachments(Config.PersonnelMatters.Smartsheet.PERSONNEL_MATTERS_TABLE_ID, row_id)
-
-        attachments = response.data
+        attachments = personnelMattersRow.attachments
         if len(attachments) == 0:
-            logger.warning(f"🚧 Smartsheet row with id: '{row_id}' has no attachments when it should.")
-            continue
+            logger.warning(f"🚧 {counter} Smartsheet row with id: '{row_id}' has no attachments when it should.")
+            return False
 
         # Create box folder
-        today_string = date.today().strftime(r"%Y-%m-%d")
-        folder_name = f"{today_string}-{personnelMattersRow.personnel_matters_id}-{personnelMattersRow.respondent}"
+        folder_name = f"{TODAYS_DATE}-{personnelMattersRow.personnel_matters_id}-{personnelMattersRow.respondent}"
         try:
             new_folder: FolderFull = box_client.folders.create_folder(name=folder_name, parent=CreateFolderParent(str(Config.PersonnelMatters.Box.PERSONNEL_MATTERS_BOX_ROOT_FOLDER_ID)))
-            logger.info(f"✅ Successfully created box folder: '{new_folder.name}'.")
+            logger.info(f"✅ {counter} Successfully created box folder: '{new_folder.name}'.")
         except Exception as e:
-            logger.exception(f"❌ Failed to create box folder for personnel matter id: '{personnelMattersRow.personnel_matters_id}'. ")
-            failed_row_ids.add(row_id)
-            continue
+            logger.exception(f"❌ {counter} Failed to create box folder for personnel matter id: '{personnelMattersRow.personnel_matters_id}'. ")
+            return True
 
+        failed = False
         for attachment in attachments:
             attachment_id = attachment.id
             # Have to manually fetch AGAIN the attachment because of a bug where listing attachments
@@ -124,7 +144,8 @@ def save_attachments_to_box(box_client: BoxClient, smartsheet_attachments_client
             # Upload file to box com
             uploaded_files: Files | None = None
             try:
-                response = requests.get(attachment_url)
+                response = s3_session.get(attachment_url, timeout=S3_DOWNLOAD_TIMEOUT_SECONDS)
+                response.raise_for_status()
 
                 file = BytesIO(response.content)
                 uploaded_files = box_client.uploads.upload_file(
@@ -133,16 +154,22 @@ def save_attachments_to_box(box_client: BoxClient, smartsheet_attachments_client
                     ),
                     file=file
                 )
-                logger.info(f"\t Successfully added attachment: {attachment_name}.")
+                logger.info(f"\t{counter} Successfully added attachment: {attachment_name}.")
             except Exception:
-                logger.warning(f"\t❌ Failed to save attachment with name: '{attachment_name}'.")
+                logger.warning(f"\t❌ {counter} Failed to save attachment with name: '{attachment_name}'.")
 
             if not uploaded_files:
-                logger.error(f"\t❌ Something failed when uploading: {attachment_name}")
-                failed_row_ids.add(row_id)
+                logger.error(f"\t❌ {counter} Something failed when uploading: {attachment_name}")
+                failed = True
                 continue
 
         logger.info(f"✅ {counter} Successfully Saved attachments for row with id: '{row_id}'...")
+        return failed
+
+    # Rows are independent, so they are saved concurrently. failed_row_ids is only written from this thread.
+    for (idx, personnelMattersRow), failed in run_concurrently(save_row_attachments_to_box, enumerate(personnelMattersRows)):
+        if failed:
+            failed_row_ids.add(personnelMattersRow.row_id)
 
 def update_smartsheet_box_sync_column(sheet_client: Sheets, personnel_matters_rows: list[PersonnelMattersRow], failed_ids: set):
     filtered_personnel_matters_rows = list(filter(lambda x: x.row_id not in failed_ids, personnel_matters_rows))
@@ -8,6 +8,7 @@ Modified by PickolZi
 """
 
 from typing import Dict, List
+import hashlib
 import logging
 from pathlib import Path
 import re
@@ -172,10 +173,18 @@ def download_image(box_file_id: str, file_name: str, workdir: Path, token: str,
         'Authorization': token,
         'As-User': user
     }
+
+    # Uploading a new version of an image keeps its Box file id, so a downloaded copy is only reused while its
+    # sha1 still matches the file's current version
+    file_path = Path(f'{box_file_id}_{file_name}')
+    if (workdir / file_path).exists():
+        response = requests.get(f'https://api.box.com/2.0/files/{box_file_id}', headers=headers, params={'fields': 'sha1'})
+        if response.status_code == 200 and response.json().get('sha1') == hashlib.sha1((workdir / file_path).read_bytes()).hexdigest():
+            logger.info(f'Reusing downloaded image {file_path}')
+            return file_path
     url = f'https://api.box.com/2.0/files/{box_file_id}/content'
     response = requests.get(url, headers=headers)
     if response.status_code == 200:
-        file_path = Path(f'{box_file_id}_{file_name}')
         logger.info(f'Saving image to {file_path}')
         with open(workdir / file_path, 'wb') as f:
             f.write(response.content)
@@ -7,13 +7,22 @@ Github link: https://github.com/XZhouQD/boxnote-converter
 Modified by PickolZi
 """
 
+import hashlib
+import io
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 from boxnote_to_html_parser import html_mapper
 
+# orjson parses bytes directly and is noticeably faster on large notes. Fall back to the stdlib when it isn't installed.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 log_format = "%(asctime)s:[%(levelname)s]:%(message)s"
 logging.basicConfig(format=log_format, level=logging.INFO)
 logger = logging.getLogger()
@@ -26,104 +35,184 @@ def parse(
         title: str = None,
         workdir: Path = None,
         access_token: str = None,
-        user_id: str = None) -> str:
+        user_id: str = None,
+        return_bytes: bool = False) -> Union[str, bytes]:
     """
-    Parse BoxNote to HTML
+    Parse BoxNote to HTML. Returns UTF-8 encoded bytes instead of a str when `return_bytes` is set.
     """
     global token
     token = access_token if access_token else token
     global user
     user = user_id if user_id else user
     try:
-        boxnote = json.loads(boxnote_content)
-    except json.JSONDecodeError as e:
+        boxnote = _loads(boxnote_content)
+    except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
         logger.error('Invalid BoxNote content: JSON parse failed')
         raise e
     
-    if 'doc' not in boxnote:
+    try:
+        doc = boxnote['doc']
+    except KeyError:
         logger.error('Invalid BoxNote content: no doc field')
         raise ValueError('Invalid BoxNote content: no doc field')
 
-    if 'content' not in boxnote.get('doc', {}):
+    try:
+        doc_content = doc['content']
+    except KeyError:
         logger.error('Invalid BoxNote content: no content field')
         raise ValueError('Invalid BoxNote content: no content field')
 
-    contents = ['<!DOCTYPE html>', '<html>', f'{html_mapper.get_base_style()}', '<head>', '<meta charset="UTF-8">', f'<title>{title}</title>', '</head>', '<body>']
+    buf = io.StringIO()
+    buf.write(f'<!DOCTYPE html><html>{html_mapper.get_base_style()}<head><meta charset="UTF-8"><title>{title}</title></head><body>')
+
+    parse_content(doc_content, buf, title, workdir)
+
+    buf.write('</body></html>')
+    result = buf.getvalue()
+    return result.encode('utf-8') if return_bytes else result
+
+
+_open = html_mapper.get_tag_open
+_close = html_mapper.get_tag_close
+_handle_text = html_mapper.handle_text_marks
+_handle_image = html_mapper.handle_image
+
+_CLOSE_TAG = object()  # Stack marker for a pending closing tag
+_EMPTY_PARAGRAPH_OPEN = html_mapper.get_tag_open('paragraph', alignment='left')  # Only empty left aligned paragraphs are dropped
+_EMPTY = {}  # Shared read-only default for nodes without attrs, avoids building a new dict per node
+
+# A handler returns (open_html, children, close_html, ignore_paragraph_in_children)
+Handled = Tuple[str, Union[Dict, List, None], str, bool]
+
+
+def _h_paragraph(content: Dict, title: str, workdir: Path, ignore_paragraph: bool) -> Handled:
+    if ignore_paragraph:
+        return '', content.get('content', []), '', False
+
+    alignment = 'left'
+    for mark in content.get('marks', []):
+        if mark.get('type', '') == 'alignment':
+            alignment = (mark.get('attrs') or _EMPTY).get('alignment', '')
+    return _open('paragraph', alignment=alignment), content.get('content', []), _close('paragraph'), False
+
+
+def _h_text(content: Dict, title: str, workdir: Path, ignore_paragraph: bool) -> Handled:
+    return _handle_text(content.get('marks', []), content.get('text', '')), None, '', False
+
+
+def _h_check_list_item(content: Dict, title: str, workdir: Path, ignore_paragraph: bool) -> Handled:
+    checked = content['attrs']['checked']
+    open_html = _open('check_list_item', checked='checked' if checked else '', x='X' if checked else '  ')
+    return open_html, content.get('content', []), _close('check_list_item'), True
+
+
+def _h_container(content: Dict, title: str, workdir: Path, ignore_paragraph: bool) -> Handled:
+    """
+    Tags whose children are rendered without their own paragraph wrappers
+    """
+    type_tag = content['type']
+    attrs = content.get('attrs') or _EMPTY
+    return _open(type_tag, **attrs), content.get('content', []), _close(type_tag, **attrs), True
+
+
+def _h_image(content: Dict, title: str, workdir: Path, ignore_paragraph: bool) -> Handled:
+    return _handle_image(content.get('attrs') or _EMPTY, title, workdir, token, user), None, '', False
+
 
-    parse_content(boxnote.get('doc', {}).get('content', {}), contents, title, workdir)
+def _h_tag(content: Dict, title: str, workdir: Path, ignore_paragraph: bool) -> Handled:
+    type_tag = content['type']
+    attrs = content.get('attrs') or _EMPTY
+    return _open(type_tag, **attrs), content.get('content', []), _close(type_tag, **attrs), False
 
-    contents = list(filter(lambda x: x is not None, contents))
-    contents.extend(['</body>', '</html>'])
-    result = ''.join(contents)
-    result = str.replace(result, '<p style="text-align: left"></p>', '')  # remove empty paragraph
-    return result
+
+HANDLERS = {
+    'paragraph': _h_paragraph,
+    'text': _h_text,
+    'check_list_item': _h_check_list_item,
+    'list_item': _h_container,
+    'table_cell': _h_container,
+    'call_out_box': _h_container,
+    'image': _h_image,
+    **dict.fromkeys(['strong', 'em', 'underline', 'strikethrough', 'ordered_list', 'bullet_list', 'blockquote', 'code_block',
+                     'check_list', 'table', 'table_row', 'heading', 'link', 'font_size', 'font_color', 'horizontal_rule'], _h_tag)
+}
 
 
 def parse_content(
         content: Union[Dict, List],
-        contents: List[str],
+        buf: io.StringIO,
         title: str,
         workdir: Path,
         ignore_paragraph: bool = False) -> None:
     """
-    Parse BoxNote content
+    Parse BoxNote content into `buf`, walking the tree with an explicit stack instead of recursion
     """
-    if not content:
-        return
-
-    if isinstance(content, list):
-        for item in content:
-            parse_content(item, contents, title, workdir, ignore_paragraph)
-        return
+    emit = buf.write
+    dropped_paragraphs = 0
+    stack = [(content, ignore_paragraph, None)]
+    while stack:
+        node, node_ignore_paragraph, closing = stack.pop()
+
+        if node is _CLOSE_TAG:
+            close_html, rollback_position, empty_position, dropped_paragraphs_at_open = closing
+            # A paragraph only emptied by dropping the ones inside it is kept, like the old single str.replace pass
+            if buf.tell() == empty_position and dropped_paragraphs == dropped_paragraphs_at_open:
+                # Drop empty paragraphs without a post-pass over the HTML
+                buf.seek(rollback_position)
+                buf.truncate()
+                dropped_paragraphs += 1
+            elif close_html:
+                emit(close_html)
+            continue
+
+        if not node:
+            continue
+
+        if isinstance(node, list):
+            stack.extend((item, node_ignore_paragraph, None) for item in reversed(node))
+            continue
+
+        if not isinstance(node, dict):
+            continue
+
+        if 'type' not in node:
+            logger.error('Invalid BoxNote content: no type field')
+            raise ValueError('Invalid BoxNote content: no type field')
+
+        handler = HANDLERS.get(node['type'])
+        if not handler:
+            continue
+
+        open_html, children, close_html, children_ignore_paragraph = handler(node, title, workdir, node_ignore_paragraph)
+        rollback_position = buf.tell()
+        if open_html:
+            emit(open_html)
+        # Only a rendered left aligned paragraph is dropped when nothing is written inside it, blank centered or
+        # right aligned lines are kept
+        empty_position = buf.tell() if node['type'] == 'paragraph' and open_html == _EMPTY_PARAGRAPH_OPEN else None
+        stack.append((_CLOSE_TAG, None, (close_html, rollback_position, empty_position, dropped_paragraphs)))
+        if children:
+            stack.append((children, children_ignore_paragraph, None))
 
-    if not isinstance(content, dict):
-        return
-
-    if 'type' not in content:
-        logger.error('Invalid BoxNote content: no type field')
-        raise ValueError('Invalid BoxNote content: no type field')
-    
-    type_tag = content.get('type', '')
-    if type_tag == 'paragraph':
-        if not ignore_paragraph:
-            alignment = 'left'
-            marks = content.get('marks', [])
-            for mark in marks:
-                if mark.get('type', '') == 'alignment':
-                    alignment = mark.get('attrs', {}).get('alignment', '')
-            contents.append(html_mapper.get_tag_open('paragraph', alignment=alignment))
-            parse_content(content.get('content', []), contents, title, workdir)
-            contents.append(html_mapper.get_tag_close('paragraph'))
-        else:
-            parse_content(content.get('content', []), contents, title, workdir)
-    elif type_tag == 'text':
-        contents.append(html_mapper.get_tag_open('text'))
-        contents.append(html_mapper.handle_text_marks(content.get('marks', []), content.get('text', '')))
-        contents.append(html_mapper.get_tag_close('text'))
-    elif type_tag == 'check_list_item':
-        args = {'checked': 'checked' if content['attrs']['checked'] else '', 'x': 'X' if content['attrs']['checked'] else '  '}
-        contents.append(html_mapper.get_tag_open('check_list_item', **args))
-        parse_content(content.get('content', []), contents, title, workdir, ignore_paragraph=True)
-        contents.append(html_mapper.get_tag_close('check_list_item'))
-    elif type_tag in ['list_item', 'table_cell', 'call_out_box']:
-        contents.append(html_mapper.get_tag_open(type_tag, **content.get('attrs', {})))
-        parse_content(content.get('content', []), contents, title, workdir, ignore_paragraph=True)
-        contents.append(html_mapper.get_tag_close(type_tag, **content.get('attrs', {})))
-    elif type_tag == 'image':
-        contents.append(html_mapper.handle_image(content.get('attrs', {}), title, workdir, token, user))
-    elif type_tag in ['strong', 'em', 'underline', 'strikethrough', 'ordered_list', 'bullet_list', 'blockquote', 'code_block', 
-                      'check_list', 'table', 'table_row', 'heading', 'link', 'font_size', 'font_color', 'horizontal_rule']:
-        contents.append(html_mapper.get_tag_open(type_tag, **content.get('attrs', {})))
-        parse_content(content.get('content', []), contents, title, workdir)
-        contents.append(html_mapper.get_tag_close(type_tag, **content.get('attrs', {})))
-    
 
 def convert_boxnote_to_html(input_boxnote_file: Path, box_token: str, output_html_file: Path):
+    """
+    Convert a .boxnote file to an HTML file. Skips the conversion when `output_html_file` was already generated
+    from a boxnote with the same content, tracked by a hash stored next to the HTML file.
+    """
     workdir = Path.cwd()
-    with open(input_boxnote_file, 'r', encoding='utf-8') as f:
+    with open(input_boxnote_file, 'rb') as f:
         content = f.read()
+
+    content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+    hash_file = output_html_file.with_suffix('.boxnote.hash')
+    if output_html_file.exists() and hash_file.exists() and hash_file.read_text() == content_hash:
+        logger.info(f'{input_boxnote_file.name} is unchanged, reusing {output_html_file.name}')
+        return
+
     title = input_boxnote_file.stem
     token = box_token
     user_id = None
-    with open(output_html_file, 'w', encoding='utf-8') as f:
-        f.write(parse(content, title, workdir, token, user_id))
\ No newline at end of file
+    with open(output_html_file, 'wb') as f:
+        f.write(parse(content, title, workdir, token, user_id, return_bytes=True))
+    hash_file.write_text(content_hash)
\ No newline at end of file
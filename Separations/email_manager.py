@@ -1,4 +1,6 @@
 import os
+import time
+import threading
 
 import smtplib
 from email.mime.application import MIMEApplication
@@ -9,6 +11,15 @@ import ssl
 from typing import Optional
 from pathlib import Path
 
+TRANSIENT_SMTP_CODES = {421, 450, 451}  # Server is busy or closing the channel, worth reconnecting and retrying
+
+
+def _is_transient_connection_error(e: OSError) -> bool:
+    if isinstance(e, smtplib.SMTPResponseException):
+        return e.smtp_code in TRANSIENT_SMTP_CODES
+    # Dropped connections and socket errors are worth retrying, other SMTP errors (e.g. no STARTTLS) won't go away
+    return isinstance(e, smtplib.SMTPServerDisconnected) or not isinstance(e, smtplib.SMTPException)
+
 class EmailManager:
     def __init__(
         self,
@@ -23,28 +34,141 @@ class EmailManager:
         self.sender_email = sender_email
         self.app_password = app_password
         self.use_tls = use_tls
+        self._ssl_context = ssl.create_default_context() if use_tls else None  # Built once, reused by every connection
+        self._thread_local = threading.local()  # Each worker thread keeps its own SMTP connection
+        self._thread_sessions: list[smtplib.SMTP] = []
+        self._thread_sessions_lock = threading.Lock()
     
     def _connect(self) -> smtplib.SMTP:
         server = smtplib.SMTP(self.smtp_server, self.port)
         server.ehlo()
         if self.use_tls:
-            server.starttls(context=ssl.create_default_context())
+            server.starttls(context=self._ssl_context)
             server.ehlo()
         server.login(self.sender_email, self.app_password)
         return server
 
+    def open_session(self) -> smtplib.SMTP:
+        """
+        Returns an authenticated SMTP connection to reuse across several `send_email` calls.
+        Use it as a context manager so the connection is closed once all emails are sent.
+        """
+        return self._connect()
+
+    def _thread_session(self) -> smtplib.SMTP:
+        server = getattr(self._thread_local, "server", None)
+        if server is not None:
+            # The server may have closed the reused connection while it sat idle, find out before anything is sent
+            code, message = server.noop()
+            if code != 250:
+                raise smtplib.SMTPResponseException(code, message)
+        else:
+            server = self._connect()
+            self._thread_local.server = server
+            with self._thread_sessions_lock:
+                self._thread_sessions.append(server)
+        return server
+
+    def _drop_thread_session(self):
+        server = getattr(self._thread_local, "server", None)
+        self._thread_local.server = None
+        if server is None:
+            return
+        with self._thread_sessions_lock:
+            self._thread_sessions.remove(server)
+        try:
+            server.close()
+        except (smtplib.SMTPException, OSError):
+            pass
+
+    def close_thread_sessions(self):
+        """
+        Closes every connection opened by `send_email_with_retry`. Call once all worker threads are done.
+        """
+        with self._thread_sessions_lock:
+            sessions, self._thread_sessions = self._thread_sessions, []
+        for server in sessions:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                server.close()
+
+    def send_email_with_retry(
+        self,
+        to: str,
+        subject: str,
+        body: Optional[str] = None,
+        html_body: Optional[str] = None,
+        prepared_attachments: Optional[list[MIMEApplication]] = None,
+        max_attempts: int = 3
+    ) -> dict:
+        """
+        Thread safe `send_email` that reuses the calling thread's own SMTP connection, opening it on first use.
+        Reconnects with exponential backoff only while the server can't have accepted the message yet, that is when
+        connecting fails or the server answers MAIL FROM with a transient error. Any later failure is raised without
+        sending the email again, since the server may already have delivered it.
+        """
+        for attempt in range(max_attempts):
+            is_last_attempt = attempt == max_attempts - 1
+            try:
+                server = self._thread_session()
+            except OSError as e:  # smtplib errors are OSErrors too
+                self._drop_thread_session()
+                if not _is_transient_connection_error(e) or is_last_attempt:
+                    raise
+                time.sleep(2 ** attempt)
+                continue
+
+            try:
+                return self.send_email(to, subject, body, html_body, server=server, prepared_attachments=prepared_attachments)
+            except smtplib.SMTPSenderRefused as e:
+                # Refused at MAIL FROM, before any recipient or data was sent
+                self._drop_thread_session()
+                if e.smtp_code not in TRANSIENT_SMTP_CODES or is_last_attempt:
+                    raise
+                time.sleep(2 ** attempt)
+            except OSError:
+                self._drop_thread_session()
+                raise
+
+    def prepare_attachments(self, attachments_path: Path) -> list[MIMEApplication]:
+        """
+        Reads and base64 encodes every file in `attachments_path` once. The returned parts are never modified
+        after this, so the same objects can be attached to many emails.
+        """
+        prepared_attachments = []
+        with os.scandir(attachments_path) as entries:
+            for entry in entries:
+                # Skip directories, only attach files
+                if not entry.is_file():
+                    continue
+
+                with open(entry.path, "rb") as attachment:
+                    mime_part = MIMEApplication(attachment.read(), Name=entry.name)
+                mime_part["Content-Disposition"] = f'attachment; filename="{entry.name}"'
+                prepared_attachments.append(mime_part)
+        return prepared_attachments
+
     def send_email(
         self,
         to: str,
         subject: str,
         body: Optional[str] = None,
         html_body: Optional[str] = None,
-        attachments_path: Optional[Path] = None
-    ):
+        attachments_path: Optional[Path] = None,
+        server: Optional[smtplib.SMTP] = None,
+        prepared_attachments: Optional[list[MIMEApplication]] = None,
+        bcc: Optional[list[str]] = None
+    ) -> dict:
+        """
+        Returns the recipients the SMTP server refused, see `smtplib.SMTP.send_message`.
+        """
         message = MIMEMultipart()
         message["From"] = self.sender_email
         message["To"] = to
         message["Subject"] = subject
+        if bcc:
+            message["Bcc"] = ", ".join(bcc)  # Stripped from the headers by send_message
 
         if body:
             message.attach(MIMEText(body, "plain"))
@@ -52,21 +176,14 @@ class EmailManager:
         if html_body:
             message.attach(MIMEText(html_body, "html"))
         
-        if attachments_path:
-            for filename in os.listdir(attachments_path):
-                file_path = os.path.join(attachments_path, filename)
+        if attachments_path and prepared_attachments is None:
+            prepared_attachments = self.prepare_attachments(attachments_path)
 
-                # Skip directories, only attach files
-                if not os.path.isfile(file_path):
-                    continue
+        for mime_part in prepared_attachments or []:
+            message.attach(mime_part)
 
-                with open(file_path, "rb") as attachment:
-                    mime_part = MIMEApplication(
-                        attachment.read(),
-                        Name=os.path.basename(filename)
-                    )
-                    mime_part["Content-Disposition"] = f'attachment; filename="{os.path.basename(filename)}"'
-                    message.attach(mime_part)
+        if server:
+            return server.send_message(message)
 
         with self._connect() as server:
-            server.send_message(message)
\ No newline at end of file
+            return server.send_message(message)
\ No newline at end of file
@@ -2,21 +2,33 @@ import re
 
 from models import SmartsheetContact
 
-def replace_email_template_placeholders(html_text: str, contact: SmartsheetContact) -> str:
+PLACEHOLDER_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+def compile_placeholder_pattern(contacts: list[SmartsheetContact]) -> re.Pattern:
     """
-    Replaces all ${KEY} occurrences in `text` using the `contact` dictionary.
-    If a KEY is not found in the dictionary, the placeholder is left unchanged.
-    Capitaliziation does not matter, however, spacing and color does. Make sure the document has no spaces between the
-    braces and make sure the braces along with the rest of the key are the same color, font, and size.
+    Builds a single case-insensitive alternation of every attribute name found on `contacts`, so filling in a
+    template for each contact is one regex pass. Placeholders that don't name an attribute are not matched and
+    are left unchanged.
     """
-    pattern = re.compile(r"\$\{([^}]+)\}")
+    keys = sorted({k for contact in contacts for k in vars(contact)}, key=len, reverse=True)
+    return re.compile(r"\$\{(" + "|".join(re.escape(k) for k in keys) + r")\}", re.IGNORECASE)
 
-    def replacer(match: re.Match) -> str:
-        key = match.group(1)
-
-        for k,v in vars(contact).items():
-            if k.lower() == key.lower():
-                return str(v)
-        return match.group(0)
+def tokenize_email_template(html_text: str, pattern: re.Pattern = PLACEHOLDER_PATTERN) -> list[str]:
+    """
+    Splits `html_text` once into [literal, key, literal, key, ..., literal] so the template can be filled in for
+    many contacts without running the regex again. `pattern` must have exactly one capture group around the key.
+    """
+    return pattern.split(html_text)
 
-    return pattern.sub(replacer, html_text)
\ No newline at end of file
+def fill_email_template(template_tokens: list[str], contact: SmartsheetContact) -> str:
+    """
+    Fills in a template from `tokenize_email_template` with the `contact`'s values.
+    If a KEY is not found on the contact, the placeholder is left unchanged.
+    Capitaliziation does not matter, however, spacing and color does. Make sure the document has no spaces between the
+    braces and make sure the braces along with the rest of the key are the same color, font, and size.
+    """
+    contact_values = {k.lower(): str(v) for k,v in vars(contact).items()}
+    return "".join(
+        token if idx % 2 == 0 else contact_values.get(token.lower(), f"${{{token}}}")
+        for idx, token in enumerate(template_tokens)
+    )
@@ -1,7 +1,7 @@
 import json
 import logging
 
-from main import main
+from main import main, init_clients
 
 # import requests
 
@@ -10,6 +10,12 @@ SMARTSHEET_COLUMN_EMAIL_STATUS_ID = 3592840163315588
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Authenticate during cold start so warm invocations reuse the cached clients. main() retries if this fails.
+try:
+    init_clients()
+except Exception:
+    logger.exception("Failed to pre-load Smartsheet/Box.com clients during cold start.")
+
 def lambda_handler(event, context):
 
     http_method = event.get("httpMethod", "GET")
@@ -1,7 +1,11 @@
 import sys
 import os
+import json
+import time
+import shutil
 import logging
 from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List
 
@@ -10,16 +14,17 @@ from smartsheet.sheets import Sheets
 from smartsheet.models import Sheet
 
 from box_sdk_gen import BoxClient
+from box_sdk_gen.box.errors import BoxSDKError
 
 from models import BoxFolder, BoxFile, SmartsheetContact
 from boxnote_to_html_parser.html_parser import convert_boxnote_to_html
 from email_manager import EmailManager
-from helpers.regex import replace_email_template_placeholders
+from helpers.regex import compile_placeholder_pattern, tokenize_email_template, fill_email_template
 
 sys.path.append("../layers/shared/python/")  # Necessary for DEV staging. AWS auto imports this file
 from shared_config.constants import Settings, Constants
 from shared_config.config import Config
-from api import get_smartsheet_sheets_client, get_box_client
+from api import get_smartsheet_sheets_client, get_box_client, update_rows_in_batches
 
 """
 Separations Script.
@@ -47,28 +52,60 @@ if Settings.STAGE == Settings.Stage.DEV:
     logger.addHandler(logger_stream_handler)
 
 PAYROLL_START_DATE_EPOCH = date(2025, 1, 6)  # Will be used to calculate every future payroll period
+BOX_DOWNLOAD_MAX_WORKERS = 8  # Box downloads are network bound, so threads overlap their latency. Keep <= 10, the SDK session's keep-alive pool size
+BOX_DOWNLOAD_BUFFER_SIZE = 1024 * 1024  # Copy downloads to disk in 1 MiB reads/writes instead of 64 KiB, small enough for 8 workers in a 128 MB Lambda
+BOX_FOLDER_ITEMS_PAGE_SIZE = 1000  # Largest page Box.com allows, most folders fit in one request
+SMARTSHEET_GET_SHEET_EXCLUDE = ["nonexistentCells", "linkInFromCellDetails", "linksOutToCellsDetails"]  # Cell details the script never reads
+EMAIL_SEND_MAX_WORKERS = 5  # Concurrent SMTP connections, Gmail allows ~15 per account
+CLIENTS_MAX_AGE_SECONDS = 50 * 60  # Box access tokens expire after ~60 minutes, refresh the clients before that
 REQUIRED_COLUMN_TITLES_MAP = {
     Config.Separations.Smartsheet.COLUMN_EMAIL_STATUS_ID: "email_status",
     Config.Separations.Smartsheet.COLUMN_STAFF_EMAIL_COLUMN_ID: "email",
     Config.Separations.Smartsheet.COLUMN_LAST_DAY_DATE_ID: "last_day_date"
 }
 
+cached_sheet_client: Sheets = None     # loaded by init_clients(), reused across warm Lambda invocations
+cached_box_client: BoxClient = None    # loaded by init_clients(), reused across warm Lambda invocations
+clients_loaded_at: float = None        # loaded by init_clients()
+
+
+def init_clients(force_refresh: bool = False) -> tuple[Sheets, BoxClient]:
+    """
+    Builds the Smartsheet and Box.com clients once and caches them at module scope, so warm Lambda invocations
+    skip re-authenticating. Clients are rebuilt once they get close to the Box token's expiry or when `force_refresh` is set.
+    """
+    global cached_sheet_client, cached_box_client, clients_loaded_at
+    is_stale = clients_loaded_at is None or time.monotonic() - clients_loaded_at > CLIENTS_MAX_AGE_SECONDS
+    if force_refresh or is_stale:
+        cached_sheet_client = get_smartsheet_sheets_client()
+        cached_box_client = get_box_client()
+        clients_loaded_at = time.monotonic()
+    return cached_sheet_client, cached_box_client
+
+def reset_clients():
+    global clients_loaded_at
+    clients_loaded_at = None
+
 def generate_missing_payroll_dates_in_smartsheet(sheet_client: Sheets) -> list:
     # TODO: Add error handling here
     logger.info(f"Generating missing payroll dates for separating contacts...")
 
     # Fetch contacts with status 'awaiting email'
     contacts = []  # [(row_id:int, last_day_date:date)]
-    res: Sheet = sheet_client.get_sheet(Config.Separations.Smartsheet.SEPARATIONS_TRACKER_TABLE_ID)
-    for row in res.to_dict().get("rows", []):
-        row_id = row.get("id")
+    res: Sheet = sheet_client.get_sheet(
+        Config.Separations.Smartsheet.SEPARATIONS_TRACKER_TABLE_ID,
+        column_ids=[Config.Separations.Smartsheet.COLUMN_LAST_DAY_DATE_ID, Config.Separations.Smartsheet.COLUMN_EMAIL_STATUS_ID],
+        exclude=SMARTSHEET_GET_SHEET_EXCLUDE
+    )
+    for row in res.rows:
+        row_id = row.id
         last_day_date = None
         email_status = None
-        for cell in row.get("cells", []):
-            if cell.get("columnId") == Config.Separations.Smartsheet.COLUMN_LAST_DAY_DATE_ID:
-                last_day_date = date.fromisoformat(cell.get("value"))
-            if cell.get("columnId") == Config.Separations.Smartsheet.COLUMN_EMAIL_STATUS_ID:
-                email_status = cell.get("value")
+        for cell in row.cells:
+            if cell.column_id == Config.Separations.Smartsheet.COLUMN_LAST_DAY_DATE_ID:
+                last_day_date = date.fromisoformat(cell.value)
+            if cell.column_id == Config.Separations.Smartsheet.COLUMN_EMAIL_STATUS_ID:
+                email_status = cell.value
         if email_status == Constants.Separations.Smartsheet.AWAITING_EMAIL_STATUS:
             contacts.append((row_id, last_day_date))
     
@@ -79,17 +116,20 @@ def generate_missing_payroll_dates_in_smartsheet(sheet_client: Sheets) -> list:
 
     # Fetch SBPD recognized holidays
     logger.info(f"Fetching SBPD recognized holiday dates from Smartsheet...")
-    holiday_sheet: Sheet = sheet_client.get_sheet(Config.Separations.Smartsheet.HOLIDAY_TABLE_ID)
-    holiday_sheet_dict = holiday_sheet.to_dict()
+    holiday_column_ids = [Config.Separations.Smartsheet.HOLIDAY_PREVIOUS_DATES_COLUMN_ID, Config.Separations.Smartsheet.HOLIDAY_UPCOMING_DATES_COLUMN_ID]
+    holiday_sheet: Sheet = sheet_client.get_sheet(
+        Config.Separations.Smartsheet.HOLIDAY_TABLE_ID,
+        column_ids=holiday_column_ids,
+        exclude=SMARTSHEET_GET_SHEET_EXCLUDE
+    )
     upcoming_holiday_dates: list[date] = []
-    for row in holiday_sheet_dict.get("rows", []):
-        cells = row.get("cells", [])
-        for cell in cells:
-            if cell.get("columnId") in [Config.Separations.Smartsheet.HOLIDAY_PREVIOUS_DATES_COLUMN_ID, Config.Separations.Smartsheet.HOLIDAY_UPCOMING_DATES_COLUMN_ID]:
+    for row in holiday_sheet.rows:
+        for cell in row.cells:
+            if cell.column_id in holiday_column_ids:
                 try:
-                    upcoming_holiday_dates.append(date.fromisoformat(cell.get("value")))
+                    upcoming_holiday_dates.append(date.fromisoformat(cell.value))
                 except ValueError:
-                    logger.error(f"Row ID: {row.get('id')}, failed to parse holiday iso str: {cell.get('value')} to holiday date")
+                    logger.error(f"Row ID: {row.id}, failed to parse holiday iso str: {cell.value} to holiday date")
     
     logger.info(f"✅ Successfully fetched {len(upcoming_holiday_dates)} holidays from SBPD Recognized Holiday sheet.")
 
@@ -138,41 +178,48 @@ def generate_missing_payroll_dates_in_smartsheet(sheet_client: Sheets) -> list:
                 ]
         }))
 
-    sheet_client.update_rows(Config.Separations.Smartsheet.SEPARATIONS_TRACKER_TABLE_ID, rows_to_update)
+    if update_rows_in_batches(sheet_client, Config.Separations.Smartsheet.SEPARATIONS_TRACKER_TABLE_ID, rows_to_update):
+        raise RuntimeError("Smartsheet rejected some payroll date updates.")
     logger.info(f"✅ Successfully generated payroll dates for separating contacts.")
     return contacts
 
-def retrieve_separating_contacts_from_smartsheet(sheet_client: Sheets) -> List[SmartsheetContact]:
+def retrieve_separating_contacts_from_smartsheet(sheet_client: Sheets, email_status_filter: str = None) -> List[SmartsheetContact]:
+    """
+    Returns a SmartsheetContact for every row of the Separations tracker. When `email_status_filter` is given, only rows
+    whose email status matches it (case-insensitive) are returned.
+    """
     logger.info(f"Retrieving separating employees from Smartsheet...")
 
     filtered_smartsheet_separating_contacts = list()
-    res: Sheet = sheet_client.get_sheet(Config.Separations.Smartsheet.SEPARATIONS_TRACKER_TABLE_ID)
-    smartsheet_json: dict = res.to_dict()
+    # Every column is kept since extra column titles become email template placeholders
+    res: Sheet = sheet_client.get_sheet(
+        Config.Separations.Smartsheet.SEPARATIONS_TRACKER_TABLE_ID,
+        exclude=SMARTSHEET_GET_SHEET_EXCLUDE
+    )
 
     # TODO: Add null checks AND error handling is really bad here. Really, come back and redo it soon. And in the main function part.
-    smartsheet_extra_column_titles_map = {}
-    for column_header in smartsheet_json.get("columns", []):
-        column_id = column_header.get("id")
-        column_title = column_header.get("title")
-        smartsheet_extra_column_titles_map[column_id] = column_title
-
-    contact_dict = {}
-    for row in smartsheet_json.get("rows", []):
-        for cell in row.get("cells", []):
-            cell_id = cell.get("columnId")
-            cell_value = cell.get("value")
-
-            if cell_id in REQUIRED_COLUMN_TITLES_MAP:
-                contact_dict[REQUIRED_COLUMN_TITLES_MAP[cell_id]] = cell_value
-            contact_dict[smartsheet_extra_column_titles_map[cell_id]] = cell_value
+    smartsheet_extra_column_titles_map = {column.id: column.title for column in res.columns}
+
+    # Keys each column's value is stored under, resolved once instead of per cell. Required columns are also stored by their renamed key.
+    column_keys_map = {
+        column_id: (REQUIRED_COLUMN_TITLES_MAP[column_id], column_title) if column_id in REQUIRED_COLUMN_TITLES_MAP else (column_title,)
+        for column_id, column_title in smartsheet_extra_column_titles_map.items()
+    }
+
+    for row in res.rows:
+        # Fresh per row, blank cells stay None instead of carrying over the previous row's value
+        contact_dict = dict.fromkeys(smartsheet_extra_column_titles_map.values())
+        for cell in row.cells:
+            cell_value = cell.value
+            for key in column_keys_map[cell.column_id]:
+                contact_dict[key] = cell_value
         
         # These 3 attributes must exist
-        email_status = contact_dict.get("email_status")
-        email = contact_dict.get("email")
-        last_day_date = contact_dict.get("last_day_date")
-        if not (email_status and email and last_day_date):
+        if not all(contact_dict.get(key) for key in REQUIRED_COLUMN_TITLES_MAP.values()):
             raise Exception("row missing crucial cell data.")  # TODO: error handling
-        contact_dict["smartsheet_row_id"] = row.get("id")
+        if email_status_filter and contact_dict["email_status"].lower() != email_status_filter.lower():
+            continue
+        contact_dict["smartsheet_row_id"] = row.id
 
         contact: SmartsheetContact = SmartsheetContact(**contact_dict)
         filtered_smartsheet_separating_contacts.append(contact)
@@ -180,41 +227,121 @@ def retrieve_separating_contacts_from_smartsheet(sheet_client: Sheets) -> List[S
     logger.info(f"✅ Successfully retrieved separating employees from Smartsheet.")
     return filtered_smartsheet_separating_contacts
 
+def download_box_file(box_client: BoxClient, file_id: str, output_path: Path):
+    download_stream = box_client.downloads.download_file(file_id)
+    if download_stream is None:
+        raise RuntimeError(f"Box.com file {file_id} is not ready to be downloaded yet.")
+
+    # The SDK copies in 64 KiB chunks, copying ourselves moves the whole buffer per read/write
+    with open(output_path, "wb") as f:
+        shutil.copyfileobj(download_stream, f, BOX_DOWNLOAD_BUFFER_SIZE)
+
+def iter_box_folder_items(box_client: BoxClient, folder_id: str):
+    """
+    Yields every entry of a Box.com folder, following marker based pagination so folders with more than one page aren't cut off.
+    """
+    marker = None
+    while True:
+        box_folder_items = box_client.folders.get_folder_items(folder_id, usemarker=True, marker=marker, limit=BOX_FOLDER_ITEMS_PAGE_SIZE)
+        yield from box_folder_items.entries
+        marker = box_folder_items.next_marker
+        if not marker:
+            return
+
+def load_box_sync_manifest() -> dict:
+    """
+    Returns the file versions downloaded by the previous run, {file_id: {"name", "file_version_id", "sha1"}}.
+    """
+    try:
+        with open(Constants.Separations.Box.SYNC_MANIFEST_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_box_sync_manifest(manifest: dict):
+    # Written to a temp file and swapped in, so a crash mid-write can't leave a half written manifest behind
+    manifest_tmp_path = Constants.Separations.Box.SYNC_MANIFEST_PATH.with_suffix(".json.tmp")
+    with open(manifest_tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_tmp_path, Constants.Separations.Box.SYNC_MANIFEST_PATH)
+
+def is_box_file_synced(manifest: dict, box_file: BoxFile, local_path: Path) -> bool:
+    synced_file = manifest.get(box_file.id)
+    return synced_file is not None \
+        and synced_file.get("file_version_id") == box_file.file_version_id \
+        and synced_file.get("sha1") == box_file.sha1 \
+        and local_path.exists()
+
 def download_attachments_and_email_template_from_box(box_client: BoxClient):
     logger.info(f"Downloading attachments and email template from Box.com...")
 
-    # Ensure proper _box_sync folder structure exists, if not, create it.
-    if not Constants.Separations.Box.SYNC_FOLDER_PATH.exists():
-        logger.info(f"  {Constants.Separations.Box.SYNC_FOLDER_PATH} does not exist. Creating it now...")
-        Constants.Separations.Box.SYNC_FOLDER_PATH.mkdir()
-    if not Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH.exists():
-        logger.info(f"  {Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH} does not exist. Creating it now...")
-        Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH.mkdir()
-    if not Constants.Separations.Box.SYNC_EMAIL_TEMPLATE_FOLDER_PATH.exists():
-        logger.info(f"  {Constants.Separations.Box.SYNC_EMAIL_TEMPLATE_FOLDER_PATH} does not exist. Creating it now...")
-        Constants.Separations.Box.SYNC_EMAIL_TEMPLATE_FOLDER_PATH.mkdir()
+    # Ensure proper _box_sync folder structure exists, parents=True also creates the _box_sync root.
+    for sync_folder_path in (Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH, Constants.Separations.Box.SYNC_EMAIL_TEMPLATE_FOLDER_PATH):
+        sync_folder_path.mkdir(parents=True, exist_ok=True)
 
     # Save attachments metadata from Box.com
     box_attachments_folder: BoxFolder = BoxFolder(str(Config.Separations.Box.IMPORTANT_ATTACHMENTS_TO_SEND_FOLDER_ID))
-    for entry in box_client.folders.get_folder_items(str(Config.Separations.Box.IMPORTANT_ATTACHMENTS_TO_SEND_FOLDER_ID)).entries:
-        box_file: BoxFile = BoxFile(entry.id, entry.name, entry.file_version.id, entry.sha_1)
-        box_attachments_folder.contents.append(box_file)
-
-    # FEATURE: Instead of constantly re-downloading attachments and email template, we can have a manifest.json to save the id and etag of our previous version and only pull from Box.com when the manifest.json files change.
+    try:
+        box_attachments_folder.contents = [
+            BoxFile(entry.id, entry.name, entry.file_version.id, entry.sha_1)
+            for entry in iter_box_folder_items(box_client, box_attachments_folder.id)
+        ]
+    except BoxSDKError as e:
+        # First Box.com call of the run. Clients are reused across warm runs, so the token may have been revoked since get_box_client validated it.
+        logger.error(f"❌ Please refresh Box.com API Developer Token.")
+        raise RuntimeError(e)
+
+    template_entry = box_client.files.get_file_by_id(str(Config.Separations.Box.EMAIL_TEMPLATE_FILE_ID))
+    box_email_template: BoxFile = BoxFile(template_entry.id, template_entry.name, template_entry.file_version.id, template_entry.sha_1)
+
+    # Attachments removed from Box.com must not be emailed anymore
+    attachment_names = {box_file.name for box_file in box_attachments_folder.contents}
+    for filename in os.listdir(Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH):
+        if filename not in attachment_names:
+            logger.info(f"  Removing attachment no longer in Box.com: {filename}")
+            os.remove(os.path.join(Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH, filename))
+
+    # Only download files whose Box.com version changed since the last run
+    manifest = load_box_sync_manifest()
+    updated_manifest = {}
     logger.info(f"Downloading files to this location: {Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH}")
-    for idx, box_file in enumerate(box_attachments_folder.contents):
-        counter = f"({idx+1}/{len(box_attachments_folder.contents)})"
-        box_attachment_path = Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH / Path(box_file.name)
-        with open(box_attachment_path, "wb") as f:
-            logger.info(f"  {counter} Downloading Box attachment: {box_file.name}...")
-            box_client.downloads.download_file_to_output_stream(box_file.id, f)
-
-    # Download email template(.boxnote extension)
-    with open(Constants.Separations.Box.EMAIL_TEMPLATE_BOXNOTE_PATH, "wb") as f:
-        logger.info(f"  Downloading email attachment: {Constants.Separations.Box.EMAIL_TEMPLATE_BOXNOTE_FILENAME}...")
-        box_client.downloads.download_file_to_output_stream(str(Config.Separations.Box.EMAIL_TEMPLATE_FILE_ID), f)
+    with ThreadPoolExecutor(max_workers=BOX_DOWNLOAD_MAX_WORKERS) as executor:
+        futures = {}  # {future: filename}
+        for idx, box_file in enumerate(box_attachments_folder.contents):
+            counter = f"({idx+1}/{len(box_attachments_folder.contents)})"
+            box_attachment_path = Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH / box_file.name
+            if is_box_file_synced(manifest, box_file, box_attachment_path):
+                logger.info(f"  {counter} Box attachment is up to date: {box_file.name}")
+            else:
+                logger.info(f"  {counter} Downloading Box attachment: {box_file.name}...")
+                futures[executor.submit(download_box_file, box_client, box_file.id, box_attachment_path)] = box_file.name
+            updated_manifest[box_file.id] = {"name": box_file.name, "file_version_id": box_file.file_version_id, "sha1": box_file.sha1}
+
+        # Download email template(.boxnote extension) alongside the attachments
+        if is_box_file_synced(manifest, box_email_template, Constants.Separations.Box.EMAIL_TEMPLATE_BOXNOTE_PATH):
+            logger.info(f"  Email template is up to date: {Constants.Separations.Box.EMAIL_TEMPLATE_BOXNOTE_FILENAME}")
+        else:
+            logger.info(f"  Downloading email attachment: {Constants.Separations.Box.EMAIL_TEMPLATE_BOXNOTE_FILENAME}...")
+            futures[executor.submit(download_box_file, box_client, box_email_template.id, Constants.Separations.Box.EMAIL_TEMPLATE_BOXNOTE_PATH)] = Constants.Separations.Box.EMAIL_TEMPLATE_BOXNOTE_FILENAME
+        updated_manifest[box_email_template.id] = {"name": box_email_template.name, "file_version_id": box_email_template.file_version_id, "sha1": box_email_template.sha1}
+
+        # Let every download finish so the log shows all the files that failed, not just the first
+        failed_filenames = []
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception:
+                logger.exception(f"  Failed to download: {futures[future]}")
+                failed_filenames.append(futures[future])
+
+    if failed_filenames:
+        raise RuntimeError(f"Failed to download {len(failed_filenames)} file(s) from Box.com: {failed_filenames}")
+
+    # Only record versions once every download succeeded, so a failed run re-downloads next time
+    save_box_sync_manifest(updated_manifest)
 
     # TODO: Look over image converting from boxnote to html as that might be broken/is untested.
+    # Skipped by the converter when the boxnote content is unchanged.
     logger.info(f"  Converting email template from boxnote to HTML format...")
     convert_boxnote_to_html(Constants.Separations.Box.EMAIL_TEMPLATE_BOXNOTE_PATH, box_client.auth.token, Constants.Separations.Box.EMAIL_TEMPLATE_HTML_PATH)
 
@@ -235,17 +362,47 @@ def send_customized_emails_and_attachments(contacts: list[SmartsheetContact]) ->
     Config.Separations.Email.SMTP_SERVER
     email_manager = EmailManager(Config.Separations.Email.SMTP_SERVER, Config.Separations.Email.PORT, Config.Separations.Email.SENDER_ADDRESS, Config.Separations.Email.SENDER_APP_PASSWORD)
 
-    for idx, contact in enumerate(contacts):
-        counter = f"{idx+1}/{len(contacts)}"
+    # Encode attachments once, they are shared by every email
+    prepared_attachments = email_manager.prepare_attachments(Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH)
+    placeholder_pattern = compile_placeholder_pattern(contacts)
+    if not placeholder_pattern.search(email_template):
+        # Nothing to personalize, so every contact gets the same message through BCC
+        logger.info(f"  Email template has no placeholders. Sending one separation email BCC'd to {len(contacts)} contacts")
         try:
-            logger.info(f"  ({counter}) Sending separation email to: {contact.email}")
-            custom_email = replace_email_template_placeholders(email_template, contact)
-            email_manager.send_email(contact.email, Config.Separations.Email.SUBJECT, None, custom_email, Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH)
-            separating_contacts_success_list.append(contact)
+            with email_manager.open_session() as server:
+                refused_emails = email_manager.send_email(Config.Separations.Email.SENDER_ADDRESS, Config.Separations.Email.SUBJECT, None, email_template, server=server, prepared_attachments=prepared_attachments, bcc=[contact.email for contact in contacts])
         except Exception as e:
-            # TODO: error map to keep track of failed emails
-            logger.warning(f"  ({counter}) Failed to send an email to: {contact.email}")
-            separating_contacts_failed_list.append(contact)
+            logger.warning(f"  Failed to send the BCC'd separation email")
+            refused_emails = {contact.email: None for contact in contacts}
+
+        for contact in contacts:
+            if contact.email in refused_emails:
+                logger.warning(f"  Failed to send an email to: {contact.email}")
+                separating_contacts_failed_list.append(contact)
+            else:
+                separating_contacts_success_list.append(contact)
+    else:
+        # Split the template once, then each worker thread sends over its own persistent SMTP connection
+        template_tokens = tokenize_email_template(email_template, placeholder_pattern)
+        try:
+            with ThreadPoolExecutor(max_workers=EMAIL_SEND_MAX_WORKERS) as executor:
+                futures = []
+                for contact in contacts:
+                    custom_email = fill_email_template(template_tokens, contact)
+                    futures.append(executor.submit(email_manager.send_email_with_retry, contact.email, Config.Separations.Email.SUBJECT, None, custom_email, prepared_attachments))
+
+                for idx, (contact, future) in enumerate(zip(contacts, futures)):
+                    counter = f"{idx+1}/{len(contacts)}"
+                    try:
+                        future.result()
+                        logger.info(f"  ({counter}) Sent separation email to: {contact.email}")
+                        separating_contacts_success_list.append(contact)
+                    except Exception as e:
+                        # TODO: error map to keep track of failed emails
+                        logger.warning(f"  ({counter}) Failed to send an email to: {contact.email}")
+                        separating_contacts_failed_list.append(contact)
+        finally:
+            email_manager.close_thread_sessions()
     
     logger.info(f"✅ Successfully finished emailing {len(separating_contacts_success_list)}/{len(contacts)} contacts.")
     return [separating_contacts_success_list, separating_contacts_failed_list]
@@ -259,39 +416,55 @@ def delete_attachments_and_email_templates():
         raise Exception("_box_sync folder does not exist when it should.")
 
     if Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH.exists():
-        for filename in os.listdir(Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH):
-            filepath = os.path.join(Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH, filename)
-            logger.info(f"  removing file: {filename}")
-            os.remove(filepath)
+        with os.scandir(Constants.Separations.Box.SYNC_ATTACHMENTS_FOLDER_PATH) as entries:
+            for entry in entries:
+                logger.info(f"  removing file: {entry.name}")
+                os.unlink(entry.path)
     else:
         raise Exception("_box_sync/attachments folder does not exist when it should.")
     
     if Constants.Separations.Box.SYNC_EMAIL_TEMPLATE_FOLDER_PATH.exists():
-        for filename in os.listdir(Constants.Separations.Box.SYNC_EMAIL_TEMPLATE_FOLDER_PATH):
-            filepath = os.path.join(Constants.Separations.Box.SYNC_EMAIL_TEMPLATE_FOLDER_PATH, filename)
-            logger.info(f"  removing file: {filename}")
-            os.remove(filepath)
+        with os.scandir(Constants.Separations.Box.SYNC_EMAIL_TEMPLATE_FOLDER_PATH) as entries:
+            for entry in entries:
+                logger.info(f"  removing file: {entry.name}")
+                os.unlink(entry.path)
     else:
         raise Exception("_box_sync/attachments folder does not exist when it should.")
 
+    # Without the files, the manifest would wrongly report them as synced
+    if Constants.Separations.Box.SYNC_MANIFEST_PATH.exists():
+        logger.info(f"  removing file: {Constants.Separations.Box.SYNC_MANIFEST_PATH.name}")
+        os.remove(Constants.Separations.Box.SYNC_MANIFEST_PATH)
+
     logger.info(f"✅ Successfully cleaned up all downloaded files.")
 
-def update_separation_contacts_email_status(sheet_client: Sheets, contacts: list[SmartsheetContact]):
+def update_separation_contacts_email_status(sheet_client: Sheets, contacts: list[SmartsheetContact]) -> list[int]:
+    """
+    Sets each contact's email status to 'email sent'. Returns the row ids Smartsheet failed to update.
+    """
     logger.info(f"Updating Separation contacts status to 'email sent'...")
 
-    new_cell = smartsheet.models.Cell()
-    new_cell.column_id = Config.Separations.Smartsheet.COLUMN_EMAIL_STATUS_ID
-    new_cell.value = Constants.Separations.Smartsheet.EMAIL_SENT_STATUS
-
     rows_to_update: List[smartsheet.models.Row] = list()
     for contact in contacts:
-        row = smartsheet.models.Row()
-        row.id = contact.smartsheet_row_id
-        row.cells.append(new_cell)
-        rows_to_update.append(row)
+        # Fresh cell per row, the SDK serializes each row's cells separately
+        rows_to_update.append(
+            smartsheet.models.Row({
+                'id': contact.smartsheet_row_id,
+                'cells': [
+                    smartsheet.models.Cell({
+                        'column_id': Config.Separations.Smartsheet.COLUMN_EMAIL_STATUS_ID,
+                        'value': Constants.Separations.Smartsheet.EMAIL_SENT_STATUS
+                    })
+                ]
+            })
+        )
 
-    response = sheet_client.update_rows(Config.Separations.Smartsheet.SEPARATIONS_TRACKER_TABLE_ID, rows_to_update)
+    failed_row_ids = update_rows_in_batches(sheet_client, Config.Separations.Smartsheet.SEPARATIONS_TRACKER_TABLE_ID, rows_to_update)
+    if failed_row_ids:
+        logger.error(f"❌ Failed to update {len(failed_row_ids)}/{len(rows_to_update)} Separation contacts.")
+        return failed_row_ids
     logger.info(f"✅ Successfully updated Separation contacts.")
+    return failed_row_ids
 
 
 def main():
@@ -305,8 +478,7 @@ def main():
     
     # Get Smartsheet and Box client
     try:
-        sheet_client: Sheets = get_smartsheet_sheets_client()
-        box_client: BoxClient = get_box_client()
+        sheet_client, box_client = init_clients()
     except Exception as e:
         logger.exception(f"❌ Failed to fetch Smartsheet/Box.com SDK Client.")
         return
@@ -322,23 +494,39 @@ def main():
         logger.exception(f"❌ Failed to generate missing payroll date(s) for new email separations.")
         return
 
-    # Retrieve all separating contacts from Smartsheet
-    try:
-        smartsheet_separating_contacts = retrieve_separating_contacts_from_smartsheet(sheet_client)
-        filtered_smartsheet_separating_contacts = list(filter(lambda contact: contact.email_status.lower() == Constants.Separations.Smartsheet.AWAITING_EMAIL_STATUS, smartsheet_separating_contacts))
+    # The Box.com sync doesn't depend on the contacts, so it downloads while Smartsheet is being read.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        box_download_future = executor.submit(download_attachments_and_email_template_from_box, box_client)
+
+        # Retrieve all separating contacts from Smartsheet
+        filtered_smartsheet_separating_contacts = None
+        try:
+            filtered_smartsheet_separating_contacts = retrieve_separating_contacts_from_smartsheet(
+                sheet_client,
+                email_status_filter=Constants.Separations.Smartsheet.AWAITING_EMAIL_STATUS
+            )
+        except Exception as e:
+            logger.exception(f"❌ Failed to retrieve separating employees from Smartsheet.")
 
-        if len(filtered_smartsheet_separating_contacts) == 0:
-            logger.info(f"There are no employees who are waiting for their automated email. Exiting program.")
+        # Wait for the attachments and email template from Box.com before any exit, so a failed sync is always
+        # cleaned up instead of leaving partial files for the next run
+        try:
+            box_download_future.result()
+        except Exception as e:
+            reset_clients()  # Box token may have been revoked, rebuild the clients on the next run
+            logger.exception(f"❌ Failed to download attachments and email template from Box.com.")
+
+            # Deletes the partially synced attachments and email template so the next run starts from a clean state
+            try:
+                delete_attachments_and_email_templates()
+            except Exception as e:
+                logger.exception(f"❌ Failed to clean up downloaded files.")
             return
-    except Exception as e:
-        logger.exception(f"❌ Failed to retrieve separating employees from Smartsheet.")
-        return
 
-    # Downloading attachments and email template from Box.com
-    try:
-        download_attachments_and_email_template_from_box(box_client)
-    except Exception as e:
-        logger.exception(f"❌ Failed to download attachments and email template from Box.com.")
+    if filtered_smartsheet_separating_contacts is None:
+        return
+    if len(filtered_smartsheet_separating_contacts) == 0:
+        logger.info(f"There are no employees who are waiting for their automated email. Exiting program.")
         return
 
     # Email contacts with filled in email templates and attachments
@@ -351,18 +539,20 @@ def main():
 
     # Update Separation contacts status to 'email sent'
     try:
-        update_separation_contacts_email_status(sheet_client, separating_contacts_success_list)
+        failed_row_ids = update_separation_contacts_email_status(sheet_client, separating_contacts_success_list)
     except Exception as e:
         logger.exception(f"❌ Failed to update Smartsheet Separation contacts.")
         return
 
-    # Deletes all attachments and email templates to revert to original state
-    try:
-        delete_attachments_and_email_templates()
-    except Exception as e:
-        logger.exception(f"❌ Failed to clean up downloaded files.")
+    # Synced attachments and email template are kept, the manifest lets the next run skip unchanged files.
+
+    if failed_row_ids:
+        # These contacts were emailed but are still awaiting email in Smartsheet, so the next run emails them again
+        failed_row_ids = set(failed_row_ids)
+        failed_emails = [contact.email for contact in separating_contacts_success_list if contact.smartsheet_row_id in failed_row_ids]
+        logger.error(f"❌ Finished Separations script with errors. Emailed contacts whose status failed to update, set it to '{Constants.Separations.Smartsheet.EMAIL_SENT_STATUS}' by hand. Rows: {sorted(failed_row_ids)}, emails: {failed_emails}")
         return
-    
+
     logger.info("✅ Successfully finished running Separations script...")
 
 if __name__ == "__main__":
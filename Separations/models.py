@@ -12,9 +12,9 @@ class BoxFile:
         
 
 class BoxFolder:
-    def __init__(self, id: str, contents: list[BoxFile] = []):
+    def __init__(self, id: str, contents: list[BoxFile] | None = None):
         self.id = id
-        self.contents = contents
+        self.contents = contents if contents is not None else []  # A shared [] default would leak files between folders
 
     def __str__(self):
         return f"<class 'models.BoxFolder'> {{'id': '{self.id}', 'contents': {self.contents}}}"
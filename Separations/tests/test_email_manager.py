@@ -0,0 +1,66 @@
+import smtplib
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from email_manager import EmailManager
+
+
+class FakeSMTP:
+    def __init__(self, send_errors: list = None):
+        self.send_errors = list(send_errors or [])
+        self.sent = 0
+
+    def noop(self):
+        return 250, b"OK"
+
+    def send_message(self, message):
+        if self.send_errors:
+            raise self.send_errors.pop(0)
+        self.sent += 1
+        return {}
+
+    def close(self):
+        pass
+
+
+def email_manager_with_connections(*connections) -> EmailManager:
+    email_manager = EmailManager("smtp.example.com", 587, "sender@example.com", "password")
+    email_manager._connect = mock.Mock(side_effect=list(connections))
+    return email_manager
+
+
+@mock.patch("email_manager.time.sleep")
+class SendEmailWithRetryTest(unittest.TestCase):
+    def test_connect_error_is_retried(self, _):
+        server = FakeSMTP()
+        email_manager = email_manager_with_connections(smtplib.SMTPConnectError(421, b"busy"), server)
+        email_manager.send_email_with_retry("to@example.com", "subject", "body")
+        self.assertEqual(server.sent, 1)
+
+    def test_transient_mail_from_refusal_is_retried(self, _):
+        first, second = FakeSMTP([smtplib.SMTPSenderRefused(421, b"busy", "sender@example.com")]), FakeSMTP()
+        email_manager = email_manager_with_connections(first, second)
+        email_manager.send_email_with_retry("to@example.com", "subject", "body")
+        self.assertEqual(second.sent, 1)
+
+    def test_failure_after_data_is_not_retried(self, _):
+        server = FakeSMTP([smtplib.SMTPDataError(421, b"closing")])
+        email_manager = email_manager_with_connections(server)
+        with self.assertRaises(smtplib.SMTPDataError):
+            email_manager.send_email_with_retry("to@example.com", "subject", "body")
+        self.assertEqual(email_manager._connect.call_count, 1)
+
+    def test_disconnect_while_sending_is_not_retried(self, _):
+        server = FakeSMTP([smtplib.SMTPServerDisconnected("Connection unexpectedly closed")])
+        email_manager = email_manager_with_connections(server)
+        with self.assertRaises(smtplib.SMTPServerDisconnected):
+            email_manager.send_email_with_retry("to@example.com", "subject", "body")
+        self.assertEqual(email_manager._connect.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from boxnote_to_html_parser import html_parser
+
+
+def paragraph(alignment: str = None, content: list = None) -> dict:
+    marks = [{"type": "alignment", "attrs": {"alignment": alignment}}] if alignment else []
+    return {"type": "paragraph", "marks": marks, "content": content or []}
+
+
+def render_body(*nodes: dict) -> str:
+    html = html_parser.parse(json.dumps({"doc": {"content": list(nodes)}}), "title")
+    return html[html.index("<body>") + len("<body>"):html.index("</body>")]
+
+
+class EmptyParagraphTest(unittest.TestCase):
+    def test_empty_left_paragraph_is_dropped(self):
+        self.assertEqual(render_body(paragraph(), paragraph("left")), "")
+
+    def test_empty_centered_paragraph_is_kept(self):
+        self.assertEqual(render_body(paragraph("center")), '<p style="text-align: center"></p>')
+
+    def test_left_paragraph_emptied_by_dropping_its_children_is_kept(self):
+        self.assertEqual(render_body(paragraph(content=[paragraph()])), '<p style="text-align: left"></p>')
+
+
+class ParagraphAlignmentTest(unittest.TestCase):
+    def test_last_alignment_mark_wins(self):
+        node = paragraph(content=[{"type": "text", "text": "hi"}])
+        node["marks"] = [{"type": "alignment", "attrs": {"alignment": "center"}}, {"type": "alignment", "attrs": {"alignment": "right"}}]
+        self.assertEqual(render_body(node), '<p style="text-align: right">hi</p>')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -65,7 +65,7 @@ def get_sheet(sheet_id: int) -> Sheet:
     logger.info(f"Retrieving Vacancies & Recruitment sheet with id: '{sheet_id}' from Smartsheet...")
     res = sheets_client.get_sheet(sheet_id)
 
-    if type(res) == smartsheet.models.Error:
+    if isinstance(res, smartsheet.models.Error):
         raise RuntimeError(f"Smartsheet sheet with id: '{sheet_id}' likely does not exist.")
     
     logger.info(f"✅ Successfully retrieved Vacancies & Recruitment sheet with id: '{sheet_id}' from Smartsheet.")
@@ -207,7 +207,7 @@ def create_new_rows_in_smartsheet(df: pd.DataFrame, smartsheet_cols_map: dict, e
         logger.warning(f"🚧 Found {dupe_entries_count} duped entries within the current DEN file.")
 
     res = sheets_client.add_rows(Config.Vacancies.Smartsheet.VACANCIES_TABLE_ID, new_rows)
-    if type(res) == smartsheet.models.Error:
+    if isinstance(res, smartsheet.models.Error):
         raise RuntimeError(res.result.message)
 
     logger.info(f"✅ Successfully created {len(df)-dupe_entries_count} new rows in Smartsheet.")
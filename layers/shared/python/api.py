@@ -1,14 +1,22 @@
 """
-    Purpose: Return Smartsheet and Box.com client
+    Purpose: Return Smartsheet and Box.com client, and the HTTP session used to download Smartsheet attachments
+        - Shared Smartsheet helpers used by more than 1 project
         - Centralized place for all 3 projects to easily get clients
         - Pulls environment variables from DEV(env vars) or PROD(AWS Secrets Manager)
         - Validates API Clients
 """
 import logging
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import smartsheet
 from smartsheet import Smartsheet
 from smartsheet.sheets import Sheets
+from smartsheet.models import Error, Row
+from smartsheet.users import Users
 from smartsheet.webhooks import Webhooks
 
 from box_sdk_gen import BoxJWTAuth, JWTConfig, BoxClient, BoxDeveloperTokenAuth
@@ -24,6 +32,11 @@ logging.getLogger("smartsheet").setLevel(logging.WARNING)  # Turn off Smartsheet
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+S3_DOWNLOAD_TIMEOUT_SECONDS = 30
+S3_DOWNLOAD_MAX_RETRIES = 3
+S3_DOWNLOAD_BACKOFF_SECONDS = 0.5  # Wait doubles after each failed attempt
+SMARTSHEET_ROWS_BATCH_SIZE = 500  # Smartsheet rejects copy_rows/update_rows requests with more rows than this
+
 
 def get_smartsheet_client() -> Smartsheet:
     """
@@ -41,9 +54,17 @@ def get_smartsheet_client() -> Smartsheet:
         logger.error("❌ SMARTSHEET_ACCESS_TOKEN is missing/blank.")
         raise RuntimeError("SMARTSHEET_ACCESS_TOKEN is missing/blank")
     
-    smartsheet_client = Smartsheet(SMARTSHEET_ACCESS_TOKEN)
-    res = Sheets(smartsheet_client).list_sheets()  # Validating that our smartsheet credentials are valid.
-    if type(res) == smartsheet.models.Error:
+    return _get_validated_smartsheet_client(SMARTSHEET_ACCESS_TOKEN)
+
+@lru_cache(maxsize=1)
+def _get_validated_smartsheet_client(access_token: str) -> Smartsheet:
+    """
+    Validates `access_token` once and reuses the same Smartsheet object for every later call with that token,
+    including warm Lambda invocations. A rotated token misses the cache and is validated again.
+    """
+    smartsheet_client = Smartsheet(access_token)
+    res = Users(smartsheet_client).get_current_user()  # Validating that our smartsheet credentials are valid, small fixed size response.
+    if isinstance(res, smartsheet.models.Error):
         err_msg = res.result.message
         logger.error(f"❌ Failed to authenticate Smartsheet client. {err_msg}")
         raise RuntimeError(err_msg)
@@ -80,7 +101,7 @@ def get_smartsheet_webhooks_client() -> Webhooks:
     
     webhooks_client = Webhooks(Smartsheet(SMARTSHEET_ACCESS_TOKEN))
     res = webhooks_client.list_webhooks()  # Validating that our smartsheet credentials are valid.
-    if type(res) == smartsheet.models.Error:
+    if isinstance(res, smartsheet.models.Error):
         err_msg = res.result.message
         logger.error(f"❌ Failed to authenticate Smartsheet Webhook client. {err_msg}")
         raise RuntimeError(err_msg)
@@ -136,9 +157,52 @@ def get_box_client() -> BoxClient:
 
     box_client = BoxClient(BoxDeveloperTokenAuth(box_access_token))
     try:
-        box_client.folders.get_folder_by_id('0')  # Runs to ensure credentials are valid.
+        box_client.folders.get_folder_by_id('0', fields=['id'])  # Runs to ensure credentials are valid, only asks for the folder id.
     except BoxSDKError as e:
         logger.error(f"❌ Please refresh Box.com API Developer Token.")
         raise RuntimeError(e)
 
-    return box_client
\ No newline at end of file
+    return box_client
+
+def get_s3_download_session() -> requests.Session:
+    """
+    Returns a requests Session for downloading Smartsheet attachments from their presigned S3 urls. Reuse it across
+    downloads so S3 connections are kept alive instead of a new TLS handshake per file. Pass
+    S3_DOWNLOAD_TIMEOUT_SECONDS as the timeout of each request.
+
+    Returns:
+        requests.Session: Session that retries connection errors and 429/5xx responses with exponential backoff.
+    """
+    # Smartsheet and Box SDK calls retry on their own, the presigned S3 download is the one plain request in a run
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=Retry(total=S3_DOWNLOAD_MAX_RETRIES, backoff_factor=S3_DOWNLOAD_BACKOFF_SECONDS, status_forcelist=[429, 500, 502, 503, 504])))
+    return session
+
+def update_rows_in_batches(sheet_client: Sheets, sheet_id: int, rows: list[Row], batch_size: int = SMARTSHEET_ROWS_BATCH_SIZE) -> list[int]:
+    """
+    Sends `rows` to the sheet in as few update_rows requests as Smartsheet allows. Partial success is allowed, so
+    one bad row doesn't stop the rest of its batch from being saved.
+
+    Args:
+        sheet_client: Smartsheet's Sheets SDK object
+        sheet_id: Id of the sheet the rows belong to
+        rows: Rows to update
+        batch_size: Most rows sent in one request
+
+    Returns:
+        list[int]: Ids of the rows that failed to update
+    """
+    failed_row_ids = []
+    for i in range(0, len(rows), batch_size):
+        batch = rows[i:i + batch_size]
+        response = sheet_client.update_rows_with_partial_success(sheet_id, batch)
+        if isinstance(response, Error):
+            batch_row_ids = [row.id for row in batch]
+            logger.error(f"❌ Failed to update rows {batch_row_ids}: {response.result.message}")
+            failed_row_ids.extend(batch_row_ids)
+            continue
+
+        for failed_item in response.failed_items or []:
+            logger.error(f"❌ Failed to update row {failed_item.row_id}: {failed_item.error.message}")
+            failed_row_ids.append(failed_item.row_id)
+    return failed_row_ids
@@ -0,0 +1,36 @@
+"""
+    Purpose: Run independent per-row work concurrently
+        - Shared by the projects that save Smartsheet rows to Box, where each row is mostly waiting on Smartsheet/Box
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterable, Iterator
+
+MAX_WORKERS = 8  # Rows worked on at once, matches the Smartsheet client's 8 pooled connections
+
+
+def run_concurrently(func: Callable[..., Any], args_list: Iterable[tuple], max_workers: int = MAX_WORKERS) -> Iterator[tuple[tuple, Any]]:
+    """
+    Calls func(*args) for every args in args_list on a thread pool.
+
+    Args:
+        func: Work for a single row. It must not write to state shared with the other calls.
+        args_list: Arguments of each call
+        max_workers: Calls running at once
+
+    Returns:
+        Iterator of (args, result) pairs in the order the calls finish. Results are yielded on the caller's thread,
+        so the caller can collect them into shared state without locking.
+
+    Throws:
+        Exception: The first exception raised by a call. Calls that haven't started yet are cancelled.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(func, *args): args for args in args_list}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        except BaseException:
+            # Don't start the remaining calls once the run is going to stop
+            for future in futures:
+                future.cancel()
+            raise
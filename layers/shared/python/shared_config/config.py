@@ -2,12 +2,9 @@ import os
 import logging
 
 from datetime import date
-from dotenv import load_dotenv
 
 from .secrets import get_secret
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 
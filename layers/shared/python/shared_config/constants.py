@@ -2,10 +2,11 @@ import os
 import logging
 
 from pathlib import Path
-from dotenv import load_dotenv
 from enum import Enum
 
-load_dotenv()
+if os.getenv("SBPD_STAGE", "").upper() != "PROD":
+    from dotenv import load_dotenv
+    load_dotenv()  # Lambda sets its variables directly, so only DEV has a .env to look for. Other modules rely on this load.
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -54,19 +55,20 @@ class Constants:
         class Box:
             def _box_sync_root_folder():
                 if Settings.STAGE == Settings.Stage.DEV:
-                    return Path.cwd() / Path("_box_sync")  # In DEV, save in project directory
-                return Path("/tmp") / Path("_box_sync")    # In AWS, can only save to /tmp
+                    return Path.cwd() / "_box_sync"  # In DEV, save in project directory
+                return Path("/tmp") / "_box_sync"    # In AWS, can only save to /tmp
             
             SYNC_FOLDER_PATH = _box_sync_root_folder()
 
-            SYNC_ATTACHMENTS_FOLDER_PATH = SYNC_FOLDER_PATH / Path("attachments")
-            SYNC_EMAIL_TEMPLATE_FOLDER_PATH = SYNC_FOLDER_PATH / Path("email_template")
+            SYNC_ATTACHMENTS_FOLDER_PATH = SYNC_FOLDER_PATH / "attachments"
+            SYNC_EMAIL_TEMPLATE_FOLDER_PATH = SYNC_FOLDER_PATH / "email_template"
+            SYNC_MANIFEST_PATH = SYNC_FOLDER_PATH / "manifest.json"  # Box.com file versions of the last successful sync
 
             EMAIL_TEMPLATE_HTML_FILENAME = "email_template.html"
             EMAIL_TEMPLATE_BOXNOTE_FILENAME = "email_template.boxnote"
 
-            EMAIL_TEMPLATE_HTML_PATH = SYNC_EMAIL_TEMPLATE_FOLDER_PATH / Path("email_template.html")
-            EMAIL_TEMPLATE_BOXNOTE_PATH = SYNC_EMAIL_TEMPLATE_FOLDER_PATH / Path("email_template.boxnote")
+            EMAIL_TEMPLATE_HTML_PATH = SYNC_EMAIL_TEMPLATE_FOLDER_PATH / EMAIL_TEMPLATE_HTML_FILENAME
+            EMAIL_TEMPLATE_BOXNOTE_PATH = SYNC_EMAIL_TEMPLATE_FOLDER_PATH / EMAIL_TEMPLATE_BOXNOTE_FILENAME
     
     class PersonnelMatters:
         class Smartsheet:
@@ -7,15 +7,12 @@ import os
 import json
 import logging
 import boto3
-from dotenv import load_dotenv
 
 from json.decoder import JSONDecodeError
 from botocore.exceptions import ClientError
 
 from .constants import Settings, AWS_SECRETS_MANAGER_SECRET_NAME
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 
@@ -92,7 +92,7 @@ def _list_webhooks() -> list[Webhook]:
     # Get EPR Tracker, Personnel Matters, and Separations Webhook ID and status from Smartsheet
     try:
         res:IndexResult = smartsheet_webhook_client.list_webhooks()
-        if type(res) == smartsheet.models.Error:
+        if isinstance(res, smartsheet.models.Error):
             raise RuntimeError(res.result.message)
 
         data = res.to_dict().get("data", [])
@@ -205,13 +205,13 @@ def create_webhook():
         })
 
         res = smartsheet_webhook_client.create_webhook(webhook_create_object)
-        if type(res) == smartsheet.models.Error:
+        if isinstance(res, smartsheet.models.Error):
             print(f"❌ Failed to create Smartsheet webhook: '{webhook_to_create.name}'\n")
             return
         
         created_webhook_id = res.data.id
         res = smartsheet_webhook_client.update_webhook(created_webhook_id, { 'enabled': True})
-        if type(res) == smartsheet.models.Error:
+        if isinstance(res, smartsheet.models.Error):
             print(f"❌ Created but failed to enable Smartsheet webhook: '{webhook_to_create.name}'\n")
             return
 
@@ -252,7 +252,7 @@ def delete_webhook():
     webhook_to_delete:Webhook = list(filter(lambda x:x.id == webhook_id, webhooks))[0]
     if webhook_to_delete.type == WebhookType.SMARTSHEET:
         res = smartsheet_webhook_client.delete_webhook(webhook_to_delete.id)
-        if type(res) == smartsheet.models.Error:
+        if isinstance(res, smartsheet.models.Error):
             print(f"❌ Failed to delete Smartsheet webhook with id: '{webhook_to_delete.id}'\n")
             return
         print(f"✅ Successfully deleted Smartsheet webhook with id: '{webhook_to_delete.id}\n")